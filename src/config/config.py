@@ -24,6 +24,14 @@ class Config:
     # API
     BFF_BASE_URL: str = os.getenv('BFF_BASE_URL', 'http://localhost:8080/api')
     API_USER_LIMITS_PATH: str = '/internal/users/{user_id}/limits'
+    USER_LIMITS_CACHE_TTL: int = int(os.getenv('USER_LIMITS_CACHE_TTL', '300'))
+    USER_LIMITS_CACHE_SIZE: int = int(os.getenv('USER_LIMITS_CACHE_SIZE', '10000'))
+    USER_LIMITS_FAILURE_TTL: int = int(os.getenv('USER_LIMITS_FAILURE_TTL', '10'))
+    # Expired limits are served while refreshing, but never once older than this
+    USER_LIMITS_MAX_STALENESS: int = int(os.getenv('USER_LIMITS_MAX_STALENESS', '1800'))
+
+    # Risk processing
+    RISK_EVALUATION_PARTITIONS: int = int(os.getenv('RISK_EVALUATION_PARTITIONS', '4'))
 
     # Web Dashboard
     ENABLE_WEB_DASHBOARD: bool = os.getenv('ENABLE_WEB_DASHBOARD', 'true').lower() in ('true', 'yes', '1')
@@ -57,5 +65,7 @@ class Config:
             return "KAFKA_TOPIC_JOB_UPDATES is not set"
         if not cls.KAFKA_TOPIC_RISK_UPDATES:
             return "KAFKA_TOPIC_RISK_NOTIFICATIONS is not set"
+        if cls.RISK_EVALUATION_PARTITIONS < 1:
+            return "RISK_EVALUATION_PARTITIONS must be at least 1"
 
         return None
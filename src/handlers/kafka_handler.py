@@ -192,6 +192,10 @@ class KafkaHandler(Generic[T]):
 
     def send_message(self, message: dict) -> None:
         """Send a message to the Kafka topic."""
+        self.send_raw(json.dumps(message).encode('utf-8'))
+
+    def send_raw(self, payload: bytes) -> None:
+        """Send an already-serialized message to the Kafka topic."""
         if not self.producer:
             logger.error("Producer not initialized")
             return
@@ -199,7 +203,7 @@ class KafkaHandler(Generic[T]):
         try:
             self.producer.produce(
                 self.topic,
-                json.dumps(message).encode('utf-8'),
+                payload,
                 callback=delivery_report
             )
             self.producer.poll(0)
@@ -247,7 +251,7 @@ class KafkaHandler(Generic[T]):
                 try:
                     message_data = _decode_and_parse_message(msg)
                     if message_data is not None:
-                        logger.debug(f"!!! NEW MESSAGE FROM {self.topic} !!!")
+                        logger.debug("!!! NEW MESSAGE FROM %s !!!", self.topic)
                         try:
                             event = self.deserializer(message_data)
                             message_handler(event)
@@ -298,7 +302,8 @@ def _decode_and_parse_message(msg) -> Optional[Dict[str, Any]]:
         The decoded message as a dictionary or None if decoding fails
     """
     try:
-        return json.loads(msg.value().decode('utf-8'))
+        # json.loads accepts the raw UTF-8 bytes directly, avoiding an intermediate str copy
+        return json.loads(msg.value())
     except json.JSONDecodeError as e:
         logger.error(f"Error decoding message: {e}")
         return None
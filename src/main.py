@@ -3,6 +3,7 @@ Trade Guard Health Service
 Main application entry point, initializes the service and starts processing messages from Kafka.
 """
 
+import logging
 import signal
 import sys
 import threading
@@ -16,6 +17,7 @@ from src.models.position_models import PositionUpdateType
 
 from src.dashboard.web_dashboard import WebDashboard
 from src.utils.log_util import setup_logging, get_logger
+from src.risk.evaluators import close_user_limits_session, prefetch_user_limits
 from src.risk.processor import RiskProcessor
 from src.state.state_manager import StateManager
 
@@ -34,6 +36,10 @@ class TradeGuardHealth:
         self.state_manager = StateManager()
         logger.info("State manager initialized")
 
+        # job_id -> (source timestamp, raw update_type) of the last event applied to that active
+        # job, used to drop redelivered duplicates; dropped once the job reaches a terminal status
+        self._last_job_events = {}
+
         self.job_handler = KafkaHandler(
             Config.KAFKA_TOPIC_JOB_UPDATES,
             JobEvent,
@@ -102,6 +108,14 @@ class TradeGuardHealth:
         3. Trigger risk analysis if needed
         """
         try:
+            # Kafka delivers at least once; a repeat of the last applied event is a no-op. Events
+            # without a source timestamp can't be told apart from a repeat, so they always apply.
+            # The raw payload is only compared when the timestamps already match.
+            source = (event.source_timestamp, event.raw_update_type)
+            if event.source_timestamp is not None and self._last_job_events.get(event.job_id) == source:
+                logger.debug("Skipping duplicate %s event for job %s", event.type, event.job_id)
+                return
+
             # Create or update job based on event
             if isinstance(event.type, Created):
                 job = Job.create_from_event(event)
@@ -112,10 +126,14 @@ class TradeGuardHealth:
                     logger.warning(f"Received event for non-existent job: {event.job_id}")
                     return
                 job.apply_event(event)
-                logger.debug(f"Updated job {job.job_id} with {event.type} event")
+                logger.debug("Updated job %s with %s event", job.job_id, event.type)
 
             self.state_manager.job_storage.store_job(job)
-            logger.debug(f"Stored job {job.job_id} in state manager")
+            if job.is_active and event.source_timestamp is not None:
+                self._last_job_events[event.job_id] = source
+            else:
+                self._last_job_events.pop(event.job_id, None)
+            logger.debug("Stored job %s in state manager", job.job_id)
 
             # Run risk analysis for non-historical events
             if not is_historical and isinstance(event.type, Created):
@@ -137,7 +155,7 @@ class TradeGuardHealth:
         """
         try:
             self.state_manager.position_storage.store_position(position)
-            logger.debug(f"Updated position for {position.symbol} on {position.venue} for user {position.user_id}")
+            logger.debug("Updated position for %s on %s for user %s", position.symbol, position.venue, position.user_id)
 
             if not is_historical:
                 if position.update_type in [PositionUpdateType.INCREASED, PositionUpdateType.DECREASED, PositionUpdateType.CLOSED]:
@@ -146,7 +164,7 @@ class TradeGuardHealth:
                     if self.web_dashboard:
                         self._update_dashboards()
                 else:
-                    logger.debug(f"Skipping evaluation for non-critical position event: {position.update_type}")
+                    logger.debug("Skipping evaluation for non-critical position event: %s", position.update_type)
                     
         except Exception as e:
             logger.error(f"Error processing position event: {e}", exc_info=True)
@@ -158,7 +176,7 @@ class TradeGuardHealth:
         """
         try:
             self.state_manager.equity_storage.store_equity(equity)
-            logger.debug(f"Updated equity for {equity.equity_key}")
+            logger.debug("Updated equity for %s", equity.equity_key)
             if self.web_dashboard:
                 self._update_dashboards()
         except Exception as e:
@@ -179,17 +197,12 @@ class TradeGuardHealth:
                 if count % 1000 == 0:
                     logger.info(f"Processed {count} historical events...")
 
-            jobs_state = self.state_manager.job_storage.get_jobs_state()
-            dca_jobs = self.state_manager.job_storage.get_dca_jobs()
-            liq_jobs = self.state_manager.job_storage.get_liq_jobs()
-
-            total_jobs = sum(len(jobs) for jobs in jobs_state.values())
-            total_dca_jobs = sum(len(jobs) for jobs in dca_jobs.values())
-            total_liq_jobs = sum(len(jobs) for jobs in liq_jobs.values())
+            total_jobs, total_dca_jobs, total_liq_jobs = self.state_manager.job_storage.get_job_counts()
 
             logger.info(f"State initialization complete. Processed {count} historical events.")
             logger.info(f"Loaded {total_jobs} jobs: {total_dca_jobs} DCA jobs, {total_liq_jobs} LIQ jobs")
-            logger.info(jobs_state)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(self.state_manager.job_storage.get_jobs_state())
 
             logger.info("Initializing positions from Kafka...")
             try:
@@ -227,7 +240,8 @@ class TradeGuardHealth:
 
         try:
             logger.info("Running risk presets for all users after historical load...")
-            all_user_ids = set(self.state_manager.job_storage.get_job_to_user_map().values()) #todo user management
+            all_user_ids = self.state_manager.job_storage.get_user_ids() #todo user management
+            prefetch_user_limits(all_user_ids)
 
             for user_id in all_user_ids:
                 self.risk_processor.run_preset("default", user_id)
@@ -300,6 +314,18 @@ class TradeGuardHealth:
         except Exception as e:
             logger.error(f"Error closing Kafka handlers: {e}", exc_info=True)
 
+        if hasattr(self, 'risk_processor') and self.risk_processor:
+            try:
+                self.risk_processor.stop()
+            except Exception as e:
+                logger.error(f"Error stopping risk processor: {e}", exc_info=True)
+
+        try:
+            close_user_limits_session()
+            logger.info("User limits HTTP session closed")
+        except Exception as e:
+            logger.error(f"Error closing user limits HTTP session: {e}", exc_info=True)
+
         if self.web_dashboard:
             try:
                 self.web_dashboard.stop_server()
@@ -5,7 +5,7 @@ It includes models for jobs, events, positions, user data, and equity.
 """
 
 from src.models.position_models import Position
-from src.models.job_models import Job
+from src.models.job_models import Job, JobKind
 from src.models.job_updates import (
     JobEvent, Type, Created, Paused, Resumed,
     Stopped, Finished, StepDone, OrdersPlaced,
@@ -16,12 +16,13 @@ from src.models.user_models import UserLimits
 from src.models.equity_models import Equity
 
 # Define exports for cleaner imports
-__all__ = [
+__all__ = (
     # Position models
     'Position',
     
     # Job models
     'Job',
+    'JobKind',
     'JobEvent',
     
     # Job event types
@@ -50,4 +51,4 @@ __all__ = [
     
     # Equity models
     'Equity',
-]
+)
@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, ClassVar
+from enum import StrEnum
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, ClassVar, FrozenSet
 from pydantic import BaseModel, Field, field_validator
 
 from src.models.job_updates import (
     JobEvent, StepDone, OrdersPlaced, Finished, 
-    Paused, Resumed, ErrorEvent, Created
+    Paused, Resumed, ErrorEvent, Created, OpenOrderLog
 )
 from src.utils import log_util
 from src.utils.datetime_utils import parse_timestamp, format_timestamp
@@ -12,6 +14,13 @@ from src.utils.datetime_utils import parse_timestamp, format_timestamp
 logger = log_util.get_logger()
 
 
+class JobKind(StrEnum):
+    """Strategy family of a job, derived from its name."""
+    DCA = "dca"
+    LIQ = "liq"
+    OTHER = "other"
+
+
 class Job(BaseModel):
     """Model representing a trading job with its full state."""
     job_id: int
@@ -27,17 +36,32 @@ class Job(BaseModel):
     last_updated: datetime
     status: Optional[str] = ""
     completed_steps: Optional[int] = 0
-    orders: Optional[List[Dict[str, Any]]] = []
+    # Placed orders are kept as the event's immutable, slotted records rather than per-order dicts
+    orders: Optional[List[OpenOrderLog]] = []
 
-    DCA_JOB_NAMES: ClassVar[List[str]] = ["dca", "Dca", "DCA"]
-    LIQ_JOB_NAMES: ClassVar[List[str]] = ["liq", "Liq", "LIQ"]
-    TERMINAL_STATUSES: ClassVar[List[str]] = ["Finished", "Stopped"]
+    # Job names are matched case-insensitively against these lowercase sets
+    DCA_JOB_NAMES: ClassVar[FrozenSet[str]] = frozenset({"dca"})
+    LIQ_JOB_NAMES: ClassVar[FrozenSet[str]] = frozenset({"liq"})
+    TERMINAL_STATUSES: ClassVar[FrozenSet[str]] = frozenset({"Finished", "Stopped"})
 
     class Config:
         json_encoders = {
             datetime: format_timestamp
         }
 
+    @field_validator('orders', mode='before')
+    @classmethod
+    def _parse_orders(cls, value: Any) -> Any:
+        """Accept stored or incoming order dicts, filling missing fields as OrdersPlaced does."""
+        if not isinstance(value, list):
+            return value
+        # One clock read per job for orders that arrive without a timestamp
+        default_timestamp = datetime.now(timezone.utc).isoformat()
+        return [
+            OpenOrderLog.from_dict(order, default_timestamp) if isinstance(order, dict) else order
+            for order in value
+        ]
+
     @property
     def id(self) -> int:
         """Alias for job_id"""
@@ -55,10 +79,8 @@ class Job(BaseModel):
 
     @property
     def job_status(self) -> str:
-        """Return status if available, otherwise map update_type to status for compatibility"""
-        if self.status:
-            return self.status
-        return self.update_type
+        """Alias for status"""
+        return self.status
 
     @property
     def strategy(self) -> str:
@@ -78,15 +100,20 @@ class Job(BaseModel):
             "duration_minutes": self.duration_minutes
         }
 
+    @property
+    def kind(self) -> JobKind:
+        """Strategy family of the job, classified once per distinct name."""
+        return _job_kind(self.name or "")
+
     @property
     def is_dca_job(self) -> bool:
         """Check if this is a DCA job based on name."""
-        return self.name.lower() in [n.lower() for n in self.DCA_JOB_NAMES]
+        return self.kind is JobKind.DCA
 
     @property
     def is_liq_job(self) -> bool:
         """Check if this is a liquidity job based on name."""
-        return self.name.lower() in [n.lower() for n in self.LIQ_JOB_NAMES]
+        return self.kind is JobKind.LIQ
 
     @property
     def is_active(self) -> bool:
@@ -124,44 +151,71 @@ class Job(BaseModel):
         if not isinstance(event.type, Created):
             raise ValueError("Can only create jobs from Created events")
             
-        return cls(
-            job_id=event.job_id,
-            user_id=event.type.data.user_id,
-            name=event.type.data.name,
-            coins=event.type.data.coins,
-            side=event.type.data.side,
-            discount_pct=event.type.data.discount_pct,
-            amount=event.type.data.amount,
-            steps_total=event.type.data.steps_total,
-            duration_minutes=event.type.data.duration_minutes,
+        # The Created payload is already coerced by Created.from_data, so the
+        # model is built without re-running field validation
+        meta = event.type.data
+        return cls.model_construct(
+            job_id=int(event.job_id),
+            user_id=meta.user_id,
+            name=meta.name,
+            coins=list(meta.coins),
+            side=meta.side,
+            discount_pct=meta.discount_pct,
+            amount=meta.amount,
+            steps_total=meta.steps_total,
+            duration_minutes=meta.duration_minutes,
             timestamp=event.timestamp,
             last_updated=event.timestamp,
-            status="Created"
+            status="Created",
+            completed_steps=0,
+            orders=[],
         )
 
     def apply_event(self, event: JobEvent) -> None:
         """Update job state based on an event."""
         self.last_updated = event.timestamp
-        
-        if isinstance(event.type, StepDone):
-            self.completed_steps = event.type.step_index
-            self.status = "In Progress"
-            
-        elif isinstance(event.type, OrdersPlaced):
-            new_orders = [vars(order) for order in event.type.orders]
-            self.orders.extend(new_orders)
-            
-        elif isinstance(event.type, Finished):
-            self.status = event.type.type_name
-            
-        elif isinstance(event.type, Paused):
-            self.status = event.type.type_name
-            
-        elif isinstance(event.type, Resumed):
-            self.status = event.type.type_name
-            
-        elif isinstance(event.type, ErrorEvent):
-            self.status = "Error"
-            
-        else:
+
+        handler = _EVENT_HANDLERS.get(type(event.type))
+        if handler is None:
             logger.warning(f"Unhandled event type: {event.type.__class__.__name__}")
+            return
+        handler(self, event.type)
+
+
+@lru_cache(maxsize=256)
+def _job_kind(name: str) -> JobKind:
+    """Classify a job name, case-insensitively, into its strategy family."""
+    name = name.lower()
+    if name in Job.DCA_JOB_NAMES:
+        return JobKind.DCA
+    if name in Job.LIQ_JOB_NAMES:
+        return JobKind.LIQ
+    return JobKind.OTHER
+
+
+def _apply_step_done(job: Job, event_type: StepDone) -> None:
+    job.completed_steps = event_type.step_index
+    job.status = "In Progress"
+
+
+def _apply_orders_placed(job: Job, event_type: OrdersPlaced) -> None:
+    job.orders.extend(event_type.orders)
+
+
+def _apply_status(job: Job, event_type: Finished | Paused | Resumed) -> None:
+    job.status = event_type.type_name
+
+
+def _apply_error(job: Job, event_type: ErrorEvent) -> None:
+    job.status = "Error"
+
+
+# Event payload type -> state transition applied by Job.apply_event
+_EVENT_HANDLERS = {
+    StepDone: _apply_step_done,
+    OrdersPlaced: _apply_orders_placed,
+    Finished: _apply_status,
+    Paused: _apply_status,
+    Resumed: _apply_status,
+    ErrorEvent: _apply_error,
+}
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Type, Union
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Mapping, Optional, Tuple, Type, Union
 import logging
 
 from src.utils.datetime_utils import parse_timestamp, format_timestamp
@@ -13,7 +14,7 @@ logger = logging.getLogger(__name__)
 # Base Classes and Registry
 # ------------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobEventType(ABC):
     type_name: str = field(init=False)
 
@@ -29,24 +30,31 @@ class JobEventType(ABC):
     def from_value(cls, data: Union[str, Dict[str, Any]]) -> 'JobEventType':
         # Case 1: Input is a simple string.
         if isinstance(data, str):
-            event_class = _EVENT_TYPE_MAP.get(data)
-            if event_class is None:
+            handler = _EVENT_DISPATCH.get(data)
+            if handler is None:
                 logger.warning("Unrecognized event type string: %s", data)
                 return UnknownEvent(raw=data)
-            return event_class.from_data(data)
+            return handler(data)
         # Case 2: Input is a dict.
         elif isinstance(data, dict):
+            fingerprint = tuple(data)
+            cached = _DICT_SHAPE_CACHE.get(fingerprint)
+            if cached is not None:
+                key, handler = cached
+                return handler(data[key])
             for key, value in data.items():
-                event_class = _EVENT_TYPE_MAP.get(key)
-                if event_class:
-                    return event_class.from_data(value)
+                handler = _EVENT_DISPATCH.get(key)
+                if handler:
+                    if len(_DICT_SHAPE_CACHE) < _DICT_SHAPE_CACHE_MAX:
+                        _DICT_SHAPE_CACHE[fingerprint] = (key, handler)
+                    return handler(value)
             raise ValueError(f"Unknown event type in object: {data}")
         else:
             logger.error("Expected string or dict for event type, got: %s", type(data))
             raise ValueError(f"Expected string or dict for event type, got: {type(data)}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnknownEvent(JobEventType):
     raw: Any
 
@@ -64,7 +72,7 @@ class UnknownEvent(JobEventType):
 
 # Simple events that do not require extra data.
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Paused(JobEventType):
     def __post_init__(self):
         object.__setattr__(self, "type_name", "Paused")
@@ -74,7 +82,7 @@ class Paused(JobEventType):
         return cls()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Resumed(JobEventType):
     def __post_init__(self):
         object.__setattr__(self, "type_name", "Resumed")
@@ -84,7 +92,7 @@ class Resumed(JobEventType):
         return cls()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stopped(JobEventType):
     def __post_init__(self):
         object.__setattr__(self, "type_name", "Stopped")
@@ -94,7 +102,7 @@ class Stopped(JobEventType):
         return cls()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finished(JobEventType):
     def __post_init__(self):
         object.__setattr__(self, "type_name", "Finished")
@@ -104,7 +112,7 @@ class Finished(JobEventType):
         return cls()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanceledOrders(JobEventType):
     def __post_init__(self):
         object.__setattr__(self, "type_name", "CanceledOrders")
@@ -116,7 +124,10 @@ class CanceledOrders(JobEventType):
 
 # Complex event: Created
 
-@dataclass(frozen=True)
+# Read-only stand-in for a missing Created payload, so defaults are used without allocating a dict
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+@dataclass(frozen=True, slots=True)
 class CreatedMeta:
     name: str
     user_id: int
@@ -128,7 +139,7 @@ class CreatedMeta:
     duration_minutes: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Created(JobEventType):
     data: CreatedMeta
 
@@ -138,11 +149,12 @@ class Created(JobEventType):
     @classmethod
     def from_data(cls, data: Any) -> 'Created':
         if not isinstance(data, dict):
-            data = {}
+            data = _EMPTY_PAYLOAD
         meta = CreatedMeta(
             name=data.get("name", ""),
             user_id=int(data.get("user_id", 0)),
-            coins=data.get("coins", []),
+            # Only allocate an empty list when the payload has no coins
+            coins=data.get("coins") or [],
             side=data.get("side", ""),
             discount_pct=float(data.get("discount_pct", 0.0)),
             amount=float(data.get("amount", 0.0)),
@@ -154,7 +166,7 @@ class Created(JobEventType):
 
 # Complex event: StepDone
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepDone(JobEventType):
     step_index: int
 
@@ -174,7 +186,7 @@ class StepDone(JobEventType):
 
 # Complex event: ErrorEvent
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorEvent(JobEventType):
     error_message: str
 
@@ -194,7 +206,7 @@ class ErrorEvent(JobEventType):
 
 # Complex event: OrdersPlaced
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenOrderLog:
     order_id: str
     symbol: str
@@ -205,7 +217,10 @@ class OpenOrderLog:
     timestamp: str
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'OpenOrderLog':
+    def from_dict(cls, data: Dict[str, Any], default_timestamp: Optional[str] = None) -> 'OpenOrderLog':
+        timestamp = data.get('timestamp')
+        if not timestamp:
+            timestamp = default_timestamp or datetime.now(timezone.utc).isoformat()
         return cls(
             order_id=data.get('order_id', ''),
             symbol=data.get('symbol', ''),
@@ -213,11 +228,23 @@ class OpenOrderLog:
             price=float(data.get('price', 0.0)),
             quantity=float(data.get('quantity', 0.0)),
             status=data.get('status', ''),
-            timestamp=data.get('timestamp', datetime.now().isoformat())
+            timestamp=timestamp
         )
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialize the order to a plain dict of primitive values."""
+        return {
+            'order_id': self.order_id,
+            'symbol': self.symbol,
+            'side': self.side,
+            'price': self.price,
+            'quantity': self.quantity,
+            'status': self.status,
+            'timestamp': self.timestamp,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrdersPlaced(JobEventType):
     orders: List[OpenOrderLog]
 
@@ -229,7 +256,9 @@ class OrdersPlaced(JobEventType):
         if not isinstance(data, list):
             logger.error("'OrdersPlaced' should be a list, but got: %s", data)
             raise ValueError("'OrdersPlaced' must be a list")
-        orders = [OpenOrderLog.from_dict(order) for order in data]
+        # One clock read per batch for orders that arrive without a timestamp
+        default_timestamp = datetime.now(timezone.utc).isoformat()
+        orders = [OpenOrderLog.from_dict(order, default_timestamp) for order in data]
         return cls(orders=orders)
 
 
@@ -237,28 +266,44 @@ class OrdersPlaced(JobEventType):
 # Registry for Event Type Dispatching
 # ------------------------------------------------------------------------------
 
-_EVENT_TYPE_MAP: Dict[str, Type[JobEventType]] = {
-    "Paused": Paused,
-    "Resumed": Resumed,
-    "Stopped": Stopped,
-    "Finished": Finished,
-    "CanceledOrders": CanceledOrders,
-    "Created": Created,
-    "StepDone": StepDone,
-    "Error": ErrorEvent,
-    "OrdersPlaced": OrdersPlaced,
+# Events without payload are immutable and carry no data, so a single shared
+# instance of each is handed out instead of constructing a new one per message.
+_PAUSED = Paused()
+_RESUMED = Resumed()
+_STOPPED = Stopped()
+_FINISHED = Finished()
+_CANCELED_ORDERS = CanceledOrders()
+
+_EVENT_DISPATCH: Dict[str, Callable[[Any], JobEventType]] = {
+    "Paused": lambda _: _PAUSED,
+    "Resumed": lambda _: _RESUMED,
+    "Stopped": lambda _: _STOPPED,
+    "Finished": lambda _: _FINISHED,
+    "CanceledOrders": lambda _: _CANCELED_ORDERS,
+    "Created": Created.from_data,
+    "StepDone": StepDone.from_data,
+    "Error": ErrorEvent.from_data,
+    "OrdersPlaced": OrdersPlaced.from_data,
 }
 
+# Payload shape (tuple of dict keys) -> (matching key, handler), so repeated shapes skip the key scan.
+_DICT_SHAPE_CACHE: Dict[Tuple[str, ...], Tuple[str, Callable[[Any], JobEventType]]] = {}
+_DICT_SHAPE_CACHE_MAX = 256
+
 
 # ------------------------------------------------------------------------------
 # Full JobEvent Model
 # ------------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class JobEvent:
     job_id: int
     timestamp: datetime  # Now explicitly a datetime object
     type: JobEventType
+    # Source fields as received, without the timestamps filled in at parse time, so
+    # redelivered copies of a message can be recognized; None when the message had none
+    source_timestamp: Any = field(default=None, compare=False, repr=False)
+    raw_update_type: Any = field(default=None, compare=False, repr=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JobEvent':
@@ -271,15 +316,20 @@ class JobEvent:
 
         event = JobEventType.from_value(data['update_type'])
         
-        # Handle timestamp parsing from string to datetime
-        timestamp_str = data.get('timestamp', datetime.now(timezone.utc).isoformat())
-        # Always use parse_timestamp to ensure timezone awareness
-        timestamp = parse_timestamp(timestamp_str)
+        # Handle timestamp parsing from string to datetime; the current time is
+        # only taken when the event carries no timestamp
+        if 'timestamp' in data:
+            # Always use parse_timestamp to ensure timezone awareness
+            timestamp = parse_timestamp(data['timestamp'])
+        else:
+            timestamp = datetime.now(timezone.utc)
             
         return cls(
             job_id=data['job_id'],
             timestamp=timestamp,
-            type=event
+            type=event,
+            source_timestamp=data.get('timestamp'),
+            raw_update_type=data['update_type'],
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -307,7 +357,7 @@ class JobEvent:
         elif isinstance(self.type, StepDone):
             result['completed_steps'] = self.type.step_index
         elif isinstance(self.type, OrdersPlaced):
-            result['orders'] = [vars(order) for order in self.type.orders]
+            result['orders'] = [order.as_dict() for order in self.type.orders]
         elif isinstance(self.type, (Paused, Resumed, Stopped, Finished)):
             result['status'] = self.type.type_name
         elif isinstance(self.type, ErrorEvent):
@@ -1,23 +1,22 @@
 """
 Models module for backward compatibility.
-Re-exports all models from specialized modules.
+Re-exports the canonical models from the src.models package.
 """
 
-# Re-export job models
-from src.models.job_models import Job, JobEvent
+from src.models import (
+    Job, JobEvent, UserLimits,
+    RiskCategory, RiskLevel, BasePattern, AtomicPattern, CompositePattern,
+)
+from src.models.risk_models import RiskRepost
 
-# Re-export user models
-from src.models.user_models import UserLimits
-
-# Re-export risk models
-from src.models.risk_models import RiskReport, Pattern, RiskCategory, RiskLevel
-
-__all__ = [
+__all__ = (
     'Job',
     'JobEvent',
     'UserLimits',
-    'RiskReport',
-    'Pattern',
+    'RiskRepost',
+    'BasePattern',
+    'AtomicPattern',
+    'CompositePattern',
     'RiskCategory',
-    'RiskLevel'
-]
+    'RiskLevel',
+)
@@ -8,6 +8,18 @@ from src.utils import log_util
 
 logger = log_util.get_logger()
 
+_POSITION_FLOAT_FIELDS = (
+    'qty', 'usdt_amt', 'entry_price', 'mark_price', 'liquidation_price',
+    'unrealized_pnl', 'cur_realized_pnl', 'cum_realized_pnl', 'leverage',
+)
+
+
+def _needs_coercion(data: Dict[str, Any]) -> bool:
+    """Check whether a flat payload carries string numbers or a string timestamp."""
+    if isinstance(data.get('timestamp'), str):
+        return True
+    return any(isinstance(data.get(field), str) for field in _POSITION_FLOAT_FIELDS)
+
 
 class PositionUpdateType(str, Enum):
     """Position update types that can be set on a Position object."""
@@ -49,6 +61,10 @@ class Position(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Position':
         """Create a Position from a dictionary."""
+        if 'position' not in data and not _needs_coercion(data):
+            # Already-typed flat payloads are validated directly by pydantic-core without copying the dict
+            return cls.model_validate(data)
+
         try:
             position_data = data.copy()
 
@@ -58,32 +74,10 @@ class Position(BaseModel):
                 position_data.update(position_details)
 
             # Convert string values to appropriate types
-            if 'qty' in position_data and isinstance(position_data['qty'], str):
-                position_data['qty'] = float(position_data['qty'])
-
-            if 'usdt_amt' in position_data and isinstance(position_data['usdt_amt'], str):
-                position_data['usdt_amt'] = float(position_data['usdt_amt'])
-
-            if 'entry_price' in position_data and isinstance(position_data['entry_price'], str):
-                position_data['entry_price'] = float(position_data['entry_price'])
-
-            if 'mark_price' in position_data and isinstance(position_data['mark_price'], str):
-                position_data['mark_price'] = float(position_data['mark_price'])
-
-            if 'liquidation_price' in position_data and isinstance(position_data['liquidation_price'], str):
-                position_data['liquidation_price'] = float(position_data['liquidation_price'])
-
-            if 'unrealized_pnl' in position_data and isinstance(position_data['unrealized_pnl'], str):
-                position_data['unrealized_pnl'] = float(position_data['unrealized_pnl'])
-
-            if 'cur_realized_pnl' in position_data and isinstance(position_data['cur_realized_pnl'], str):
-                position_data['cur_realized_pnl'] = float(position_data['cur_realized_pnl'])
-
-            if 'cum_realized_pnl' in position_data and isinstance(position_data['cum_realized_pnl'], str):
-                position_data['cum_realized_pnl'] = float(position_data['cum_realized_pnl'])
-
-            if 'leverage' in position_data and isinstance(position_data['leverage'], str):
-                position_data['leverage'] = float(position_data['leverage'])
+            for field in _POSITION_FLOAT_FIELDS:
+                value = position_data.get(field)
+                if isinstance(value, str):
+                    position_data[field] = float(value)
 
             if 'timestamp' in position_data and isinstance(position_data['timestamp'], str):
                 position_data['timestamp'] = parse_timestamp(position_data['timestamp'])
@@ -1,22 +1,31 @@
 from datetime import datetime, timedelta, timezone
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache, partial
 import hashlib
-from typing import List, Dict, Any, Optional,Literal, cast
-from pydantic import BaseModel, Field, computed_field, model_validator
+import math
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional,Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, field_serializer, field_validator, model_validator
 
 from src.utils import log_util
+from src.utils.datetime_utils import format_timestamp
 
 logger = log_util.get_logger()
 
 
-class RiskCategory(str, Enum):
-    """Enumeration of risk categories"""
+class RiskCategory(StrEnum):
+    """
+    Enumeration of risk categories.
+
+    As a StrEnum, members hash and compare with str's C slots, which keeps them
+    cheap as dict keys in category_weights/category_scores, and format as their value.
+    """
     OVERCONFIDENCE = "overconfidence"
     FOMO = "fomo"
     LOSS_BEHAVIOR = "loss_behavior"  # loss-aversion + loss-seeking
 
 
-class RiskLevel(str, Enum):
+class RiskLevel(StrEnum):
     """Enumeration of risk severity levels."""
     NONE = "None"
     LOW = "low"  # < 30
@@ -25,15 +34,52 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"  # > 90
 
 
+# Current UTC time without a per-call lambda frame
+_utc_now = partial(datetime.now, timezone.utc)
+
+# Field delimiter for internal_id fingerprints
+_SEPARATOR = b'||'
+
+# Positional layout for per-category weight vectors.
+_CATEGORY_ORDER = tuple(RiskCategory)
+
+
+@lru_cache(maxsize=256)
+def _pattern_type(pattern_id: str) -> str:
+    """Return the pattern family prefix of a pattern id (text before the first underscore)."""
+    return pattern_id.partition('_')[0]
+
+
+def _hundredths(value: float) -> bytes:
+    """Encode a score at 2-decimal resolution for internal_id; NaN and infinities by name."""
+    if math.isfinite(value):
+        return str(round(value * 100)).encode()
+    return repr(value).encode()
+
+
+# Equal split across all categories, used when a pattern declares no weights.
+_EQUAL_CATEGORY_WEIGHTS: Mapping[RiskCategory, float] = MappingProxyType(
+    dict.fromkeys(_CATEGORY_ORDER, 1.0 / len(_CATEGORY_ORDER))
+)
+
+
 def default_category_weights() -> Dict[RiskCategory, float]:
-    equal_weight = 1.0 / len(RiskCategory)
-    return cast(Dict[RiskCategory, float], {
-        category: equal_weight for category in RiskCategory
-    })
+    return dict(_EQUAL_CATEGORY_WEIGHTS)
+
+
+# Shared by all risk models. Patterns are not frozen: composition marks atomic
+# patterns as consumed in place. Enum fields keep their members (not use_enum_values),
+# matching what model_construct stores; as StrEnums they still dump as plain strings.
+_RISK_MODEL_CONFIG = ConfigDict(
+    extra='ignore',
+    validate_assignment=False,
+)
 
 
 class BasePattern(BaseModel):
     """Base model for a pattern."""
+    model_config = _RISK_MODEL_CONFIG
+
     pattern_id: str
     job_id: Optional[List[int]] = None
     position_key: Optional[str] = None
@@ -41,18 +87,32 @@ class BasePattern(BaseModel):
     message: str
     category_weights: Optional[Dict[RiskCategory, float]] = Field(default_factory=default_category_weights)
     details: Optional[Dict[str, Any]] = None
-    start_time: Optional[datetime] = Field(default_factory=lambda: datetime.now(timezone.utc))
+    start_time: Optional[datetime] = Field(default_factory=_utc_now)
     end_time: Optional[datetime] = None
     show_if_not_consumed: bool = True  # some atomic patterns should not be shown if not consumed
     is_composite: bool = False
     unique: bool = False  # if True, only one instance of this pattern can exist at a time
     ttl_minutes: Optional[int] = 60  # Time-to-live in minutes, None = no expiration
 
+    _internal_id: Optional[str] = PrivateAttr(default=None)
+    _weights: Optional[Tuple[float, ...]] = PrivateAttr(default=None)
+
+    @property
+    def weights(self) -> Tuple[float, ...]:
+        """Category weights as a tuple aligned to RiskCategory order, computed once per instance."""
+        private = self.__pydantic_private__
+        weights = private['_weights']
+        if weights is None:
+            category_weights = self.category_weights or {}
+            weights = private['_weights'] = tuple(
+                category_weights.get(category, 0.0) for category in _CATEGORY_ORDER)
+        return weights
+
     @property
     def category(self) -> RiskCategory:
         """Get the primary category for this pattern."""
-        weights = self.category_weights
-        return max(weights.items(), key=lambda x: x[1])[0]
+        weights = self.weights
+        return _CATEGORY_ORDER[max(range(len(weights)), key=weights.__getitem__)]
 
     @property
     def is_active(self) -> bool:
@@ -76,33 +136,61 @@ class BasePattern(BaseModel):
     @computed_field
     @property
     def internal_id(self) -> str:
+        """Unique ID hash for pattern tracking, computed once per instance."""
+        # Private attributes are read from __pydantic_private__ directly: attribute access
+        # falls back to BaseModel.__getattr__, which is far slower than the dict lookup.
+        private = self.__pydantic_private__
+        internal_id = private['_internal_id']
+        if internal_id is None:
+            internal_id = private['_internal_id'] = self._compute_internal_id()
+        return internal_id
+
+    def _compute_internal_id(self) -> str:
         """Generate a unique ID hash for pattern tracking."""
+        # Non-cryptographic fingerprint: blake2b with a 6-byte digest yields the 12 hex chars directly.
+        # Fields are fed to the hasher one by one instead of being rendered into an intermediate
+        # string; empty fields are skipped as before.
+        hasher = hashlib.blake2b(digest_size=6)
+        update = hasher.update
+
+        update(self.pattern_id.encode())
+        if self.start_time:
+            update(_SEPARATOR)
+            update(round(self.start_time.timestamp() * 1_000_000).to_bytes(8, 'big', signed=True))
+
         if self.is_composite:
-            data = [
-                self.pattern_id,
-                self.start_time.isoformat() if self.start_time else '',
-                '_'.join(sorted(self.component_patterns)) if hasattr(self, 'component_patterns') else '',
-                f"{self.confidence:.2f}" if hasattr(self, 'confidence') else '',
-                '_'.join(
-                    f"{k}:{v:.2f}" for k, v in sorted(self.category_weights.items())) if self.category_weights else ''
-            ]
+            if getattr(self, 'component_patterns', None):
+                update(_SEPARATOR)
+                for component in sorted(self.component_patterns):
+                    update(component.encode())
+                    update(b'_')
+            if hasattr(self, 'confidence'):
+                update(_SEPARATOR)
+                update(_hundredths(self.confidence))
         else:
-            data = [
-                self.pattern_id,
-                self.start_time.isoformat() if self.start_time else '',
-                '_'.join(map(str, self.job_id)) if self.job_id else '',
-                self.position_key or '',
-                f"{self.severity:.2f}" if hasattr(self, 'severity') else '',
-                '_'.join(
-                    f"{k}:{v:.2f}" for k, v in sorted(self.category_weights.items())) if self.category_weights else ''
-            ]
-
-        data_str = '||'.join(filter(None, data))
-        hash_obj = hashlib.md5(data_str.encode())
-        short_hash = hash_obj.hexdigest()[:12]
-
-        pattern_type = self.pattern_id.split('_')[0] if '_' in self.pattern_id else self.pattern_id
-        return f"{pattern_type}:{short_hash}"
+            if self.job_id:
+                update(_SEPARATOR)
+                for job_id in self.job_id:
+                    update(str(job_id).encode())
+                    update(b'_')
+            if self.position_key:
+                update(_SEPARATOR)
+                update(self.position_key.encode())
+            if hasattr(self, 'severity'):
+                update(_SEPARATOR)
+                update(_hundredths(self.severity))
+
+        if self.category_weights:
+            update(_SEPARATOR)
+            for category, weight in sorted(self.category_weights.items()):
+                update(category.encode())
+                update(b':')
+                update(_hundredths(weight))
+                update(b'_')
+
+        short_hash = hasher.hexdigest()
+
+        return f"{_pattern_type(self.pattern_id)}:{short_hash}"
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BasePattern":
@@ -134,10 +222,8 @@ class AtomicPattern(BasePattern):
         if not raw_weights:
             return values
 
-        all_categories = set(RiskCategory)
         provided_weights = {RiskCategory(cat): weight for cat, weight in raw_weights.items()}
-        specified = set(provided_weights.keys())
-        missing = all_categories - specified
+        missing = [cat for cat in _CATEGORY_ORDER if cat not in provided_weights]
 
         total = sum(provided_weights.values())
 
@@ -152,7 +238,7 @@ class AtomicPattern(BasePattern):
                 provided_weights[cat] = distributed
 
         # Ensure all categories are present
-        for cat in all_categories:
+        for cat in _CATEGORY_ORDER:
             provided_weights.setdefault(cat, 0.0)
 
         values["category_weights"] = provided_weights
@@ -175,18 +261,48 @@ class RiskRepost(BaseModel):
     category_scores: Dict[RiskCategory, float]
     patterns: List[AtomicPattern]
     composite_patterns: List[CompositePattern]
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utc_now)
     atomic_patterns_number: int = 0
     composite_patterns_number: int = 0
     consumed_patterns_number: int = 0
 
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat(),
-            Enum: lambda e: e.value
-        }
+    model_config = _RISK_MODEL_CONFIG
+
+    @field_validator('top_risk_type', mode='before')
+    @classmethod
+    def _resolve_risk_type(cls, value: Any) -> Any:
+        """Resolve raw category values through the enum's value index."""
+        if not isinstance(value, str):
+            return value
+        return RiskCategory._value2member_map_.get(value, value)
+
+    @field_validator('top_risk_level', mode='before')
+    @classmethod
+    def _resolve_risk_level(cls, value: Any) -> Any:
+        """Resolve raw level values through the enum's value index."""
+        if not isinstance(value, str):
+            return value
+        return RiskLevel._value2member_map_.get(value, value)
+
+    @field_validator('category_scores', mode='before')
+    @classmethod
+    def _resolve_category_keys(cls, value: Any) -> Any:
+        """Remap raw category keys to enum members in a single pass."""
+        if not isinstance(value, dict):
+            return value
+        lookup = RiskCategory._value2member_map_.get
+        return {lookup(key, key): score for key, score in value.items()}
+
+    @field_serializer('timestamp', when_used='json')
+    def _serialize_timestamp(self, value: datetime) -> str:
+        """Emit the report timestamp in the Kafka-style UTC format shared with the other topics."""
+        return format_timestamp(value)
+
+    def to_kafka_bytes(self) -> bytes:
+        """Serialize the report to UTF-8 JSON bytes ready for the Kafka producer."""
+        return self.model_dump_json().encode('utf-8')
 
     @property
     def has_patterns(self) -> bool:
         """Check if the alert contains any patterns."""
-        return len(self.patterns) > 0
+        return bool(self.patterns)
@@ -1,5 +1,5 @@
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Any, Optional, ClassVar
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from src.utils import log_util
 
@@ -7,57 +7,27 @@ logger = log_util.get_logger()
 
 
 class UserLimits(BaseModel):
-    """Model representing trading limits for a user."""
+    """
+    Model representing trading limits for a user.
+
+    Fields are populated from the API's camelCase keys but stored under the
+    snake_case names the evaluators read, so every lookup is a plain attribute load.
+    Instances are frozen so cached limits can be shared between evaluations.
+    """
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
     id: int
-    userId: int
-    maxSingleJobLimit: float
-    maxDailyTradingLimit: float
+    user_id: int = Field(alias='userId')
+    max_position_size: float = Field(alias='maxSingleJobLimit')
+    max_daily_volume: float = Field(alias='maxDailyTradingLimit')
     maxPortfolioRisk: float
-    maxConcurrentOrders: int
-    maxDailyTrades: int
-    tradingCooldown: int
-    dailyLossLimit: float
+    max_concurrent_jobs: int = Field(alias='maxConcurrentOrders')
+    max_daily_trades: int = Field(alias='maxDailyTrades')
+    min_trade_interval_minutes: int = Field(alias='tradingCooldown')
+    max_daily_loss: float = Field(alias='dailyLossLimit')
     maxDailyBalanceChange: float
 
-    @property
-    def user_id(self) -> int:
-        """Alias for userId"""
-        return self.userId
-
-    @property
-    def max_daily_trades(self) -> int:
-        """Alias for maxDailyTrades"""
-        return self.maxDailyTrades
-
-    @property
-    def max_daily_volume(self) -> float:
-        """Alias for maxDailyTradingLimit"""
-        return self.maxDailyTradingLimit
-
-    @property
-    def min_trade_interval_minutes(self) -> int:
-        """Alias for tradingCooldown"""
-        return self.tradingCooldown
-
-    @property
-    def max_trade_interval_minutes(self) -> int:
-        """Default value for max trade interval"""
-        return 1440  # 24 hours
-
-    @property
-    def max_concurrent_jobs(self) -> int:
-        """Alias for maxConcurrentOrders"""
-        return self.maxConcurrentOrders
-
-    @property
-    def max_daily_loss(self) -> float:
-        """Alias for dailyLossLimit"""
-        return self.dailyLossLimit
-
-    @property
-    def max_position_size(self) -> float:
-        """Alias for maxSingleJobLimit"""
-        return self.maxSingleJobLimit
+    max_trade_interval_minutes: ClassVar[int] = 1440  # 24 hours
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UserLimits":
@@ -66,4 +36,4 @@ class UserLimits(BaseModel):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the model to a dictionary."""
-        return self.model_dump()
+        return self.model_dump(by_alias=True)
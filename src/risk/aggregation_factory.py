@@ -1,26 +1,59 @@
-from collections import defaultdict
+import math
+from bisect import bisect_right
 from typing import List, Optional, Dict
 
-from src.models.risk_models import AtomicPattern, CompositePattern, RiskCategory, RiskLevel, RiskRepost
+import numpy as np
+
+from src.models.risk_models import _CATEGORY_ORDER, AtomicPattern, CompositePattern, RiskCategory, RiskLevel, RiskRepost
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Lower bounds (inclusive) of each risk level above NONE; any positive confidence is at least LOW.
+_RISK_LEVEL_THRESHOLDS = (math.nextafter(0.0, 1.0), 0.5, 0.7, 0.9)
+_RISK_LEVELS = (RiskLevel.NONE, RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+# Column index of each category in the per-pattern weight rows (BasePattern.weights layout).
+_CATEGORY_INDEX = {category: index for index, category in enumerate(_CATEGORY_ORDER)}
+
+
+def _category_scores(
+        composite_scores: np.ndarray,
+        composite_mask: np.ndarray,
+        atomic_severities: np.ndarray,
+        atomic_weights: np.ndarray,
+        atomic_mask: np.ndarray,
+) -> np.ndarray:
+    """
+    Aggregate pattern scores per category in one pass over the pattern matrices.
+
+    A category touched by any composite pattern takes the max composite score
+    (confidence times the pattern's primary category weight) and ignores atomics.
+    Otherwise it takes the mean of its atomic contributions: severity times the
+    category weight, halved to give composites priority, times the primary weight.
+    Columns follow _CATEGORY_ORDER; the result is clipped to 1.0 but not rounded.
+    """
+    composite_best = np.where(composite_mask, composite_scores[:, None], -np.inf).max(axis=0, initial=-np.inf)
+
+    primary_weights = atomic_weights.max(axis=1, initial=0.0)
+    contributions = atomic_severities[:, None] * (atomic_weights * 0.5) * primary_weights[:, None]
+    counts = atomic_mask.sum(axis=0)
+    totals = np.where(atomic_mask, contributions, 0.0).sum(axis=0)
+    atomic_mean = np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0)
+
+    return np.minimum(np.where(composite_mask.any(axis=0), composite_best, atomic_mean), 1.0)
+
 
 class AggregationFactory:
     # def __init__(self):
     #     ...
     @staticmethod
     def calculate_risk_level(confidence: float) -> RiskLevel:
-        if confidence >= 0.9:
-            return RiskLevel.CRITICAL
-        elif confidence >= 0.7:
-            return RiskLevel.HIGH
-        elif confidence >= 0.5:
-            return RiskLevel.MEDIUM
-        elif confidence > 0.0:
-            return RiskLevel.LOW
-        return RiskLevel.NONE
+        """Map a confidence in [0, 1] to its risk level via the threshold table."""
+        if math.isnan(confidence):
+            # bisect would place NaN past every threshold; it fails every comparison, so it is NONE
+            return RiskLevel.NONE
+        return _RISK_LEVELS[bisect_right(_RISK_LEVEL_THRESHOLDS, confidence)]
 
     @staticmethod
     def calculate_composite_confidence(patterns: List[AtomicPattern]) -> float:
@@ -36,44 +69,10 @@ class AggregationFactory:
         if not patterns:
             return 0.0
             
-        # Calculate confidence as average of component severities
-        confidence = sum(p.severity for p in patterns) / len(patterns)
+        # Calculate confidence as average of component severities (exactly rounded sum)
+        confidence = math.fsum(p.severity for p in patterns) / len(patterns)
         return round(confidence, 2)
 
-    @staticmethod
-    def calculate_aggregated_confidence(patterns: List[CompositePattern | AtomicPattern]) -> float:
-        """
-        Calculate aggregated confidence using weighted average method.
-        If composite patterns exist, only use those. Otherwise, use atomic patterns.
-        
-        Args:
-            patterns: List of patterns to aggregate, each with its category weight
-            
-        Returns:
-            Aggregated confidence value between 0 and 1, rounded to 2 decimal places
-        """
-        if not patterns:
-            return 0.0
-
-        composite_patterns = [p for p in patterns if isinstance(p, CompositePattern)]
-        atomic_patterns = [p for p in patterns if not isinstance(p, CompositePattern)]
-
-        # If composite patterns, only use them (MAX confidence)
-        if composite_patterns:
-            composite_score = max(
-                p.confidence * p.category_weights[p.category]
-                for p in composite_patterns
-            )
-            return min(1.0, round(composite_score, 2))
-        
-        # If no composite patterns, use atomic patterns
-        if atomic_patterns:
-            atomic_score = sum(p.severity * p.category_weights[p.category]
-                             for p in atomic_patterns) / len(atomic_patterns)
-            return min(1.0, round(atomic_score, 2))
-        
-        return 0.0
-
     @staticmethod
     def aggregate(
             patterns: List[AtomicPattern],
@@ -81,43 +80,47 @@ class AggregationFactory:
             user_id: int,
     ) -> RiskRepost:
 
-        logger.info(f"[AggregationFactory] Starting aggregation for user {user_id}")
-        logger.info(f"[AggregationFactory] Input patterns: {len(patterns)} atomic, {len(composite_patterns)} composite")
+        logger.info("[AggregationFactory] Aggregating %d atomic and %d composite patterns for user %s",
+                    len(patterns), len(composite_patterns), user_id)
 
         atomic_patterns_number = len(patterns)
         composite_patterns_number = len(composite_patterns)
-        consumed_patterns_number = sum(1 for p in patterns if p.consumed)
+        consumed_patterns_number = 0
+        # Checked once so the per-pattern loops skip the logging call entirely when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        category_to_patterns: Dict[RiskCategory, List[AtomicPattern | CompositePattern]] = defaultdict(list)
+        # Categories in first-seen order, keyed as they appear in the patterns' weights
+        category_order: Dict[RiskCategory, None] = {}
+        composite_scores, composite_mask = [], []
+        atomic_severities, atomic_weights, atomic_mask = [], [], []
 
         for pattern in composite_patterns:
-            logger.info(f"[AggregationFactory] Processing composite pattern: {pattern.pattern_id}")
-            for category, weight in pattern.category_weights.items():
-                weighted_pattern = CompositePattern(**pattern.dict())
-                category_to_patterns[category].append(weighted_pattern)
-                logger.info(
-                    f"[AggregationFactory] Added to category {category} with original confidence {weighted_pattern.confidence}")
+            if debug:
+                logger.debug("[AggregationFactory] Processing composite pattern: %s", pattern.pattern_id)
+            category_weights = pattern.category_weights
+            category_order.update(dict.fromkeys(category_weights))
+            composite_scores.append(pattern.confidence * max(pattern.weights))
+            composite_mask.append([category in category_weights for category in _CATEGORY_ORDER])
 
-        for pattern in patterns:
-            if not pattern.is_composite and not pattern.consumed:
-                logger.info(f"[AggregationFactory] Processing atomic pattern: {pattern.pattern_id}")
-                for category, weight in pattern.category_weights.items():
-                    weighted_pattern = AtomicPattern(**pattern.dict())
-                    # Apply 50% factor to atomic patterns to give composites higher priority
-                    weighted_pattern.severity *= weight * 0.5
-                    category_to_patterns[category].append(weighted_pattern)
-                    logger.info(f"[AggregationFactory] Added to category {category} with weight {weight * 0.5}")
-
-        # Compute final category scores using weighted aggregation
-        category_scores: Dict[RiskCategory, float] = {
-            cat: AggregationFactory.calculate_aggregated_confidence(pats)
-            for cat, pats in category_to_patterns.items()
-        }
-        logger.info(f"[AggregationFactory] Category scores: {category_scores}")
+        # Atomics only score categories no composite touches, so patterns confined to those are skipped
+        composite_categories = set(category_order)
 
-        if not category_scores:
+        # One pass over the atomic patterns: count consumed ones, collect the rest
+        for pattern in patterns:
+            if pattern.consumed:
+                consumed_patterns_number += 1
+            elif not pattern.is_composite and not composite_categories.issuperset(pattern.category_weights):
+                if debug:
+                    logger.debug("[AggregationFactory] Processing atomic pattern: %s", pattern.pattern_id)
+                category_weights = pattern.category_weights
+                category_order.update(dict.fromkeys(category_weights))
+                atomic_severities.append(pattern.severity)
+                atomic_weights.append(pattern.weights)
+                atomic_mask.append([category in category_weights for category in _CATEGORY_ORDER])
+
+        if not category_order:
             logger.info("[AggregationFactory] No category scores found, returning default report")
-            return RiskRepost(
+            return RiskRepost.model_construct(
                 user_id=user_id,
                 top_risk_confidence=0.0,
                 top_risk_type=RiskCategory.OVERCONFIDENCE,  # default fallback
@@ -130,12 +133,28 @@ class AggregationFactory:
                 consumed_patterns_number=consumed_patterns_number,
             )
 
+        width = len(_CATEGORY_ORDER)
+        scores = _category_scores(
+            np.asarray(composite_scores, dtype=np.float64),
+            np.asarray(composite_mask, dtype=bool).reshape(-1, width),
+            np.asarray(atomic_severities, dtype=np.float64),
+            np.asarray(atomic_weights, dtype=np.float64).reshape(-1, width),
+            np.asarray(atomic_mask, dtype=bool).reshape(-1, width),
+        ).tolist()
+
+        # Compute final category scores using weighted aggregation. Rounding stays per value:
+        # np.round is not correctly rounded at the .xx5 boundaries and would shift some scores.
+        category_scores: Dict[RiskCategory, float] = {
+            category: round(scores[_CATEGORY_INDEX[category]], 2)
+            for category in category_order
+        }
+        logger.debug("[AggregationFactory] Category scores: %s", category_scores)
+
         top_risk_type, top_confidence = max(category_scores.items(), key=lambda x: x[1])
         top_risk_level = AggregationFactory.calculate_risk_level(top_confidence)
-        logger.info(
-            f"[AggregationFactory] Top risk: {top_risk_type} at {top_risk_level} (confidence: {top_confidence})")
+        logger.info("[AggregationFactory] Top risk: %s at %s (confidence: %s)", top_risk_type, top_risk_level, top_confidence)
 
-        return RiskRepost(
+        return RiskRepost.model_construct(
             user_id=user_id,
             top_risk_confidence=top_confidence,
             top_risk_type=top_risk_type,
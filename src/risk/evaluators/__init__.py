@@ -5,7 +5,7 @@ Contains evaluators for different risk patterns and behaviors.
 """
 
 from src.risk.evaluators.base import BaseRiskEvaluator, RiskDataProvider
-from src.risk.evaluators.user_limits import UserLimitsEvaluator
+from src.risk.evaluators.user_limits import UserLimitsEvaluator, close_user_limits_session, prefetch_user_limits
 from src.risk.evaluators.trading_behavior import TradingBehaviorEvaluator
 from src.risk.evaluators.positions_evaluator import PositionEvaluator
 from typing import Dict
@@ -14,6 +14,8 @@ from src.state.state_manager import StateManager
 __all__ = [
     'BaseRiskEvaluator',
     'UserLimitsEvaluator',
+    'prefetch_user_limits',
+    'close_user_limits_session',
     'TradingBehaviorEvaluator',
     'PositionEvaluator',
     'create_evaluators'
@@ -10,10 +10,17 @@ This covers limits on:
 - Concurrent jobs
 """
 import math
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 
 from src.models import Job, AtomicPattern, RiskCategory
 from src.models.position_models import PositionUpdateType, Position
@@ -27,25 +34,198 @@ from src.state.state_manager import StateManager
 logger = get_logger()
 
 
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with a shared connection pool and retries for the limits API."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                          max_retries=Retry(total=3, backoff_factor=0.1))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = _create_session()
+
+# (connect, read) timeouts: an unreachable limits API fails fast, a slow one still gets time to answer
+_REQUEST_TIMEOUT = (1.0, 5.0)
+
+
+@lru_cache(maxsize=10_000)
+def _user_limits_url(user_id: int) -> str:
+    """Limits API URL for a user; memoized since it only depends on the user ID."""
+    return Config.get_user_limits_url(user_id)
+
+
+# Bounded LRU of fetched limits: user_id -> (limits, monotonic fetch time)
+_user_limits_cache: "OrderedDict[int, Tuple[UserLimits, float]]" = OrderedDict()
+_user_limits_cache_lock = Lock()
+
+# Users whose last fetch failed: user_id -> monotonic failure time, so a failing
+# upstream is not hit again for every evaluation until USER_LIMITS_FAILURE_TTL passes
+_failed_user_limits: "OrderedDict[int, float]" = OrderedDict()
+_FAILED_USER_LIMITS_MAX = 1024
+
+# Fetches in progress: user_id -> future of the fetch, so concurrent misses share one request
+_inflight_user_limits: Dict[int, "Future[Optional[UserLimits]]"] = {}
+
+# Refreshes of expired entries run here while callers keep using the stale limits
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="user-limits-refresh")
+
+
+def _lookup_user_limits(user_id: int) -> Tuple[Optional[UserLimits], bool]:
+    """
+    Return the cached limits for a user, if any, and whether they are still within the TTL.
+
+    Entries older than the maximum staleness are dropped rather than served.
+    """
+    with _user_limits_cache_lock:
+        entry = _user_limits_cache.get(user_id)
+        if entry is None:
+            return None, False
+        limits, fetched_at = entry
+        age = time.monotonic() - fetched_at
+        if age >= Config.USER_LIMITS_MAX_STALENESS:
+            del _user_limits_cache[user_id]
+            return None, False
+        _user_limits_cache.move_to_end(user_id)
+        return limits, age < Config.USER_LIMITS_CACHE_TTL
+
+
+def _get_cached_user_limits(user_id: int) -> Optional[UserLimits]:
+    """Return cached limits for a user if present and not older than the TTL."""
+    limits, fresh = _lookup_user_limits(user_id)
+    return limits if fresh else None
+
+
+def _recently_failed(user_id: int) -> bool:
+    """Check whether fetching the user's limits failed within the failure TTL."""
+    with _user_limits_cache_lock:
+        failed_at = _failed_user_limits.get(user_id)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at >= Config.USER_LIMITS_FAILURE_TTL:
+            del _failed_user_limits[user_id]
+            return False
+        return True
+
+
+def _record_failed_fetch(user_id: int) -> None:
+    """Remember a failed fetch, dropping the oldest failures beyond the size cap."""
+    with _user_limits_cache_lock:
+        _failed_user_limits[user_id] = time.monotonic()
+        _failed_user_limits.move_to_end(user_id)
+        while len(_failed_user_limits) > _FAILED_USER_LIMITS_MAX:
+            _failed_user_limits.popitem(last=False)
+
+
+def _cache_user_limits(user_id: int, limits: UserLimits) -> None:
+    """Store limits for a user, evicting the least recently used entries beyond the size cap."""
+    with _user_limits_cache_lock:
+        _user_limits_cache[user_id] = (limits, time.monotonic())
+        _user_limits_cache.move_to_end(user_id)
+        while len(_user_limits_cache) > Config.USER_LIMITS_CACHE_SIZE:
+            _user_limits_cache.popitem(last=False)
+
+
 def _get_user_limits(user_id: int) -> Optional[UserLimits]:
     """
     Get the user's trading limits, with caching to avoid excessive API calls.
 
+    Expired limits are returned as-is while they are refreshed in the
+    background, recent failures are cached briefly and concurrent requests
+    for the same user share a single fetch.
+
     Args:
         user_id: User ID
 
     Returns:
-        UserLimits object (either from API or defaults)
+        UserLimits object, or None if they could not be fetched
     """
+    limits, fresh = _lookup_user_limits(user_id)
+    if limits is not None:
+        if fresh:
+            logger.debug(f"Using cached limits for user {user_id}")
+        else:
+            logger.debug(f"Using stale limits for user {user_id} while refreshing")
+            _refresh_user_limits(user_id)
+        return limits
+
+    if _recently_failed(user_id):
+        logger.debug(f"Limits fetch for user {user_id} failed recently, skipping")
+        return None
+
+    with _user_limits_cache_lock:
+        future = _inflight_user_limits.get(user_id)
+        owner = future is None
+        if owner:
+            future = _inflight_user_limits[user_id] = Future()
+
+    if not owner:
+        return future.result()
+
+    return _complete_fetch(user_id, future)
+
+
+def _refresh_user_limits(user_id: int) -> None:
+    """Start a background refresh of a user's limits unless one is already running."""
+    if _recently_failed(user_id):
+        return
+
+    with _user_limits_cache_lock:
+        if user_id in _inflight_user_limits:
+            return
+        future = _inflight_user_limits[user_id] = Future()
+
     try:
-        url = f"{Config.BFF_BASE_URL}{Config.API_USER_LIMITS_PATH.format(user_id=user_id)}"
+        task = _refresh_executor.submit(_complete_fetch, user_id, future)
+    except RuntimeError:
+        # Executor already shut down
+        _abandon_fetch(user_id, future)
+        return
+    # Queued refreshes are cancelled on shutdown without ever running _complete_fetch
+    task.add_done_callback(lambda task: task.cancelled() and _abandon_fetch(user_id, future))
+
+
+def _abandon_fetch(user_id: int, future: "Future[Optional[UserLimits]]") -> None:
+    """Release an in-flight slot whose fetch will never run, so waiters and later fetches don't block."""
+    with _user_limits_cache_lock:
+        if _inflight_user_limits.get(user_id) is future:
+            del _inflight_user_limits[user_id]
+    future.set_result(None)
+    logger.debug(f"Background refresh of limits for user {user_id} skipped after shutdown")
+
+
+def _complete_fetch(user_id: int, future: "Future[Optional[UserLimits]]") -> Optional[UserLimits]:
+    """Fetch a user's limits as the owner of their in-flight future and resolve it for any waiters."""
+    limits = None
+    try:
+        limits = _fetch_user_limits(user_id)
+        return limits
+    finally:
+        with _user_limits_cache_lock:
+            del _inflight_user_limits[user_id]
+        future.set_result(limits)
+
+
+def _fetch_user_limits(user_id: int) -> Optional[UserLimits]:
+    """
+    Fetch the user's trading limits from the API and cache them.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        UserLimits object, or None if the request failed
+    """
+    try:
+        url = _user_limits_url(user_id)
         logger.debug(f"Fetching limits for user {user_id} from {url}")
 
-        response = requests.get(url=url, timeout=10.0)
+        response = _session.get(url=url, timeout=_REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             data = response.json()
-            logger.info(f"Successfully fetched user limits: {data}")
+            logger.debug("Successfully fetched user limits: %s", data)
 
             mapped_data = {
                 "id": data.get("id", user_id),
@@ -60,17 +240,46 @@ def _get_user_limits(user_id: int) -> Optional[UserLimits]:
                 "maxDailyBalanceChange": data.get("maxDailyBalanceChange", 0.2),
             }
 
-            logger.info(f"Mapped data for UserLimits model: {mapped_data}")
+            logger.debug("Mapped data for UserLimits model: %s", mapped_data)
 
             limits = UserLimits(**mapped_data)
 
             logger.info(
                 f"User {user_id} limits: daily trades={limits.max_daily_trades}, position size={limits.max_position_size}, concurrent jobs={limits.max_concurrent_jobs}")
+            _cache_user_limits(user_id, limits)
             return limits
 
+        logger.error(f"Unexpected status {response.status_code} fetching user limits for user {user_id}")
+
     except Exception as e:
         logger.error(f"Error fetching user limits for user {user_id}: {str(e)}")
-        return None
+
+    _record_failed_fetch(user_id)
+    return None
+
+
+def prefetch_user_limits(user_ids: Iterable[int], max_workers: int = 16) -> None:
+    """
+    Warm the limits cache for many users at once, overlapping the API round-trips.
+
+    Args:
+        user_ids: IDs of the users about to be evaluated
+        max_workers: Maximum number of concurrent requests
+    """
+    missing = [user_id for user_id in set(user_ids) if _get_cached_user_limits(user_id) is None]
+    if not missing:
+        return
+
+    logger.info(f"Prefetching limits for {len(missing)} users")
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+        for _ in executor.map(_get_user_limits, missing):
+            pass
+
+
+def close_user_limits_session() -> None:
+    """Stop background refreshes and close the pooled limits API connections; call once on shutdown."""
+    _refresh_executor.shutdown(wait=False, cancel_futures=True)
+    _session.close()
 
 
 class UserLimitsEvaluator(BaseRiskEvaluator):
@@ -102,7 +311,7 @@ class UserLimitsEvaluator(BaseRiskEvaluator):
                 return []
             last_key = next(reversed(job_history))
             job = job_history[last_key]
-            logger.info(f"[UserLimitsEvaluator] Latest job timestamp: {job.timestamp}, tzinfo: {job.timestamp.tzinfo}")
+            logger.debug("[UserLimitsEvaluator] Latest job timestamp: %s, tzinfo: %s", job.timestamp, job.timestamp.tzinfo)
 
             position_histories = self.state_manager.position_storage.get_user_position_histories(
                 user_id=user_id,
@@ -115,7 +324,7 @@ class UserLimitsEvaluator(BaseRiskEvaluator):
             patterns = []
 
             user_limits = _get_user_limits(user_id)
-            logger.info(f"[UserLimitsEvaluator] Got user limits: {user_limits}")
+            logger.debug("[UserLimitsEvaluator] Got user limits: %s", user_limits)
 
             if not user_limits:
                 logger.error(f"Could not get valid user limits for user {user_id}, skipping evaluation")
@@ -153,8 +362,13 @@ class UserLimitsEvaluator(BaseRiskEvaluator):
 
             try:
                 logger.debug("[UserLimitsEvaluator] Running concurrent jobs check...")
-                if pattern := self._check_concurrent_jobs(job_history=job_history, limits=user_limits):
-                    patterns.append(pattern)
+                # The unwindowed active count bounds the 24h one, so only users that
+                # could be over the limit pay for the windowed lookup
+                active_count = self.state_manager.job_storage.get_user_active_job_count(user_id)
+                if active_count - 1 > (user_limits.max_concurrent_jobs or 0):
+                    active_jobs = self.state_manager.job_storage.get_user_active_jobs(user_id, 24)
+                    if pattern := self._check_concurrent_jobs(active_jobs=active_jobs, limits=user_limits):
+                        patterns.append(pattern)
             except Exception as e:
                 logger.error(f"[UserLimitsEvaluator] Error in concurrent jobs check: {str(e)}")
 
@@ -372,7 +586,7 @@ class UserLimitsEvaluator(BaseRiskEvaluator):
 
         return None
 
-    def _check_concurrent_jobs(self, job_history: Dict[int, Job],
+    def _check_concurrent_jobs(self, active_jobs: Dict[int, Job],
                                limits: UserLimits) -> Optional[AtomicPattern]:
         """
         Check if concurrent jobs limit is exceeded at any point in the job history.
@@ -380,7 +594,7 @@ class UserLimitsEvaluator(BaseRiskEvaluator):
         were running simultaneously.
 
         Args:
-            job_history: Dictionary of jobs (job_id -> Job)
+            active_jobs: Dictionary of active jobs (job_id -> Job)
             limits: User limits configuration
 
         Returns:
@@ -391,10 +605,7 @@ class UserLimitsEvaluator(BaseRiskEvaluator):
             logger.warning("Missing or invalid concurrent jobs limit, skipping check")
             return None
 
-        open_jobs = []
-        for history_job in job_history.values():
-            if history_job.is_active:
-                open_jobs.append(history_job)
+        open_jobs = list(active_jobs.values())
 
         open_jobs_count = len(open_jobs) - 1
         max_concurrent = limits.max_concurrent_jobs
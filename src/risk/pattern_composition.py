@@ -305,8 +305,7 @@ class PatternCompositionEngine:
 
                 # If we found valid combinations, add the best one for this position
                 if valid_combinations:
-                    valid_combinations.sort(key=self._score_combination, reverse=True)
-                    all_valid_combinations.append(valid_combinations[0])
+                    all_valid_combinations.append(max(valid_combinations, key=self._score_combination))
 
             return all_valid_combinations
 
@@ -321,8 +320,7 @@ class PatternCompositionEngine:
                 valid_combinations = self._find_window_combinations(rule, recent_patterns)
 
             if valid_combinations:
-                valid_combinations.sort(key=self._score_combination, reverse=True)
-                return [valid_combinations[0]]
+                return [max(valid_combinations, key=self._score_combination)]
 
             return []
 
@@ -331,7 +329,7 @@ class PatternCompositionEngine:
         """Check if we have enough patterns of each required type."""
         for pattern_id, required_count in rule.pattern_requirements.items():
             if required_count != '0':
-                available_count = len(patterns_by_id.get(pattern_id, []))
+                available_count = len(patterns_by_id.get(pattern_id, ()))
                 if available_count < int(required_count.rstrip('+')):
                     return False
 
@@ -4,17 +4,17 @@ Risk Processor
 Manages risk evaluation for jobs by running multiple evaluators independently.
 Each evaluator analyzes specific aspects of risk and sends its own report.
 """
-import json
+import logging
 import queue
-import time
 from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
-from threading import Thread
-from typing import List
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, List, Set
 
 from src.models.risk_models import (
     RiskLevel, AtomicPattern
 )
+from src.config.config import Config
 from src.risk.aggregation_factory import AggregationFactory
 from src.risk.evaluators import create_evaluators, BaseRiskEvaluator
 from src.utils.log_util import get_logger
@@ -54,8 +54,19 @@ class RiskProcessor:
         self.evaluators = create_evaluators(state_manager)
         self.executor = ThreadPoolExecutor(max_workers=10)
         self.evaluation_queue = Queue(maxsize=1000)
+
+        # Each user's evaluations run on one single-threaded partition (user_id % N),
+        # so runs for the same user never overlap and keep their order
+        self.user_executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"risk-user-{i}")
+            for i in range(Config.RISK_EVALUATION_PARTITIONS)
+        ]
+        # Evaluator IDs requested per user and not started yet; repeat requests merge in here
+        self._pending_evaluations: Dict[int, Set[str]] = {}
+        self._pending_lock = Lock()
         self.state_manager = state_manager
         self.kafka_handler = None
+        self._stop_event = Event()
         
         # Initialize pattern composition engine
         from src.risk.pattern_composition import PatternCompositionEngine
@@ -81,6 +92,15 @@ class RiskProcessor:
         """Set the Kafka handler for publishing alerts."""
         self.kafka_handler = kafka_handler
 
+    def stop(self) -> None:
+        """Stop the background threads and shut down the evaluation executors."""
+        self._stop_event.set()
+        # Partition tasks submit evaluator runs to the shared executor, so drain them before closing it
+        for executor in self.user_executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("[RiskProcessor] Stopped")
+
     def run_preset(self, preset_name: str, user_id: int):
         """Run a predefined group of evaluators"""
         logger.info(f"[RiskProcessor] run_preset called: preset={preset_name}, user_id={user_id}")
@@ -89,33 +109,47 @@ class RiskProcessor:
         evaluator_ids = self.presets[preset_name]
         return self.run_evaluators(evaluator_ids, user_id)
 
-    def run_evaluators(self, evaluator_ids: List[str], user_id: int):
+    def run_evaluators(self, evaluator_ids: Iterable[str], user_id: int):
         """Run specific evaluators by ID"""
+        with self._pending_lock:
+            pending = self._pending_evaluations.get(user_id)
+            if pending is not None:
+                # An evaluation for this user is still waiting to start and will read the latest state
+                pending.update(evaluator_ids)
+                return
+            self._pending_evaluations[user_id] = set(evaluator_ids)
+
         try:
-            self.evaluation_queue.put(
-                (evaluator_ids, user_id),
-                timeout=1
-            )
+            self.evaluation_queue.put(user_id, timeout=1)
         except queue.Full:
+            with self._pending_lock:
+                self._pending_evaluations.pop(user_id, None)
             logger.warning("Evaluation queue full, dropping request")
 
     def _process_evaluations(self):
         """Thread that processes evaluation requests"""
         logger.info("[RiskProcessor] Evaluation thread started")
-        while True:
+        while not self._stop_event.is_set():
             try:
-                evaluator_ids, user_id = self.evaluation_queue.get(timeout=1)
-                logger.info(f"[RiskProcessor] Got evaluation job: {evaluator_ids} for user {user_id}")
-                self.executor.submit(
-                    self._run_evaluators_threaded,
-                    evaluator_ids,
-                    user_id,
-                )
+                user_id = self.evaluation_queue.get(timeout=1)
+                logger.info(f"[RiskProcessor] Got evaluation job for user {user_id}")
+                partition = self.user_executors[user_id % len(self.user_executors)]
+                partition.submit(self._run_pending_evaluations, user_id)
             except queue.Empty:
                 continue
+            except RuntimeError:
+                # Partitions were shut down by stop() while this request was being dispatched
+                break
+
+    def _run_pending_evaluations(self, user_id: int):
+        """Run the evaluators requested for a user since their evaluation was queued"""
+        with self._pending_lock:
+            evaluator_ids = self._pending_evaluations.pop(user_id, None)
+        if evaluator_ids and not self._stop_event.is_set():
+            self._run_evaluators_threaded(evaluator_ids, user_id)
 
     def _run_evaluators_threaded(self,
-                                 evaluator_ids: List[str],
+                                 evaluator_ids: Iterable[str],
                                  user_id: int
                                  ):
         """Run specified evaluators in parallel"""
@@ -136,8 +170,9 @@ class RiskProcessor:
                 if patterns:
                     all_patterns.extend(patterns)
                     logger.info(f"[RiskProcessor] Evaluator {evaluator_id} returned {len(patterns)} patterns")
-                    for pattern in patterns:
-                        logger.debug(f"[RiskProcessor] Pattern from {evaluator_id}: {pattern.pattern_id} (severity: {pattern.severity})")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for pattern in patterns:
+                            logger.debug(f"[RiskProcessor] Pattern from {evaluator_id}: {pattern.pattern_id} (severity: {pattern.severity})")
                 else:
                     logger.info(f"[RiskProcessor] Evaluator {evaluator_id} returned NO patterns")
             except Exception as e:
@@ -166,21 +201,25 @@ class RiskProcessor:
 
             try:
                 logger.info("[RiskProcessor] Getting current pattern state...")
-                unique_patterns = [p for p in stored_patterns if p.unique]
-                non_unique_patterns = [p for p in stored_patterns if not p.unique]
-                consumed_patterns = [p for p in stored_patterns if p.consumed]
-                unconsumed_patterns = [p for p in stored_patterns if not p.consumed]
+                total_count = len(stored_patterns)
+                unique_count = sum(1 for p in stored_patterns if p.unique)
+                consumed_count = sum(1 for p in stored_patterns if p.consumed)
                 
-                logger.info(f"[RiskProcessor] Current pattern state for user {user_id}:")
-                logger.info(f"  Total patterns: {len(stored_patterns)}")
-                logger.info(f"  Unique patterns: {len(unique_patterns)}")
-                logger.info(f"  Non-unique patterns: {len(non_unique_patterns)}")
-                logger.info(f"  Consumed patterns: {len(consumed_patterns)}")
-                logger.info(f"  Unconsumed patterns: {len(unconsumed_patterns)}")
+                logger.info(
+                    "[RiskProcessor] Current pattern state for user %s:\n"
+                    "  Total patterns: %d\n"
+                    "  Unique patterns: %d\n"
+                    "  Non-unique patterns: %d\n"
+                    "  Consumed patterns: %d\n"
+                    "  Unconsumed patterns: %d",
+                    user_id, total_count, unique_count, total_count - unique_count,
+                    consumed_count, total_count - consumed_count,
+                )
                 
                 # Log pattern IDs for debugging
-                logger.debug("Unique pattern IDs: " + ", ".join(p.pattern_id for p in unique_patterns))
-                logger.debug("Non-unique pattern IDs: " + ", ".join(p.pattern_id for p in non_unique_patterns))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unique pattern IDs: " + ", ".join(p.pattern_id for p in stored_patterns if p.unique))
+                    logger.debug("Non-unique pattern IDs: " + ", ".join(p.pattern_id for p in stored_patterns if not p.unique))
             except Exception as e:
                 logger.error(f"[RiskProcessor] Error getting pattern state: {str(e)}", exc_info=True)
             
@@ -190,17 +229,22 @@ class RiskProcessor:
                 logger.info(f"[RiskProcessor] Input patterns for composition: {[p.pattern_id for p in stored_patterns]}")
                 composite_patterns = self.pattern_composition_engine.process_patterns(stored_patterns)
                 if composite_patterns:
-                    logger.info(f"[RiskProcessor] Detected {len(composite_patterns)} composite patterns")
-                    for pattern in composite_patterns:
-                        logger.info(f"[RiskProcessor] Composite pattern: {pattern.pattern_id} (confidence: {pattern.confidence})")
-                        logger.info(f"[RiskProcessor] Composite pattern components: {pattern.component_patterns}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("\n".join([
+                            f"[RiskProcessor] Detected {len(composite_patterns)} composite patterns",
+                            *(f"  - {pattern.pattern_id} (confidence: {pattern.confidence}), "
+                              f"components: {pattern.component_patterns}"
+                              for pattern in composite_patterns),
+                        ]))
                 else:
                     logger.info("[RiskProcessor] No composite patterns detected")
 
-                logger.info("[RiskProcessor] Starting pattern aggregation")
-                logger.info(f"[RiskProcessor] Input for aggregation:")
-                logger.info(f"  - Atomic patterns: {len(stored_patterns)}")
-                logger.info(f"  - Composite patterns: {len(composite_patterns)}")
+                logger.info(
+                    "[RiskProcessor] Starting pattern aggregation\n"
+                    "  - Atomic patterns: %d\n"
+                    "  - Composite patterns: %d",
+                    len(stored_patterns), len(composite_patterns),
+                )
                 report = AggregationFactory.aggregate(
                     stored_patterns,
                     composite_patterns,
@@ -213,15 +257,17 @@ class RiskProcessor:
                 if self.kafka_handler:
                     logger.info("[RiskProcessor] Preparing to send report to Kafka")
                     try:
-                        json_string = report.model_dump_json()
-                        message = json.loads(json_string)
-                        self.kafka_handler.send_message(message)
-                        logger.info(f"[RiskProcessor] Successfully sent report to Kafka. Report details:")
-                        logger.info(f"  - Top risk: {report.top_risk_type} at {report.top_risk_level}")
-                        logger.info(f"  - Confidence: {report.top_risk_confidence}")
-                        logger.info(f"  - Categories: {list(report.category_scores.keys())}")
-                        logger.info(f"  - Atomic patterns: {len(report.patterns)}")
-                        logger.info(f"  - Composite patterns: {len(report.composite_patterns)}")
+                        self.kafka_handler.send_raw(report.to_kafka_bytes())
+                        logger.info(
+                            "[RiskProcessor] Successfully sent report to Kafka. Report details:\n"
+                            "  - Top risk: %s at %s\n"
+                            "  - Confidence: %s\n"
+                            "  - Categories: %s\n"
+                            "  - Atomic patterns: %d\n"
+                            "  - Composite patterns: %d",
+                            report.top_risk_type, report.top_risk_level, report.top_risk_confidence,
+                            list(report.category_scores), len(report.patterns), len(report.composite_patterns),
+                        )
                     except Exception as e:
                         logger.error(f"[RiskProcessor] Error sending report to Kafka: {str(e)}", exc_info=True)
                 else:
@@ -239,12 +285,13 @@ class RiskProcessor:
                     
                     if self.kafka_handler:
                         try:
-                            json_string = report.model_dump_json()
-                            message = json.loads(json_string)
-                            self.kafka_handler.send_message(message)
-                            logger.info(f"[RiskProcessor] Sent fallback report to Kafka. Report details:")
-                            logger.info(f"  - Top risk: {report.top_risk_type} at {report.top_risk_level}")
-                            logger.info(f"  - Confidence: {report.top_risk_confidence}")
+                            self.kafka_handler.send_raw(report.to_kafka_bytes())
+                            logger.info(
+                                "[RiskProcessor] Sent fallback report to Kafka. Report details:\n"
+                                "  - Top risk: %s at %s\n"
+                                "  - Confidence: %s",
+                                report.top_risk_type, report.top_risk_level, report.top_risk_confidence,
+                            )
                         except Exception as e:
                             logger.error(f"[RiskProcessor] Error sending fallback report to Kafka: {str(e)}", exc_info=True)
                 except Exception as e:
@@ -255,13 +302,13 @@ class RiskProcessor:
     def _run_periodic_evaluation(self):
         """Thread that runs periodic evaluation of all users' positions."""
         logger.info("[RiskProcessor] Periodic evaluation thread started")
-        while True:
+        while not self._stop_event.is_set():
             try:
                 all_positions = self.state_manager.position_storage.get_all_positions()
                 for user_id in all_positions.keys():
                     self.run_preset("positions_only", user_id)
 
-                time.sleep(20) # todo 60
+                self._stop_event.wait(20) # todo 60
             except Exception as e:
                 logger.error(f"[RiskProcessor] Error in periodic evaluation: {str(e)}", exc_info=True)
-                time.sleep(20)
+                self._stop_event.wait(20)
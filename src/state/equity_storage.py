@@ -191,16 +191,12 @@ class EquityStorage:
             user_id = equity.user_id
             venue = equity.venue
             
-            # Initialize user's equity state if needed
-            if user_id not in self._equity_state:
-                self._equity_state[user_id] = {}
-                
-            # Initialize venue's equity state if needed
-            if venue not in self._venue_equity:
-                self._venue_equity[venue] = {}
+            # Initialize user's and venue's equity state if needed
+            user_equity = self._equity_state.setdefault(user_id, {})
+            venue_equity = self._venue_equity.setdefault(venue, {})
                 
             # Get previous state to check for changes
-            prev_equity = self._equity_state.get(user_id, {}).get(venue)
+            prev_equity = user_equity.get(venue)
             
             # Determine event type and whether to store in history
             store_in_history = False
@@ -233,8 +229,8 @@ class EquityStorage:
                     store_in_history = True
                     
             # Always update current state
-            self._equity_state[user_id][venue] = equity
-            self._venue_equity[venue][user_id] = equity
+            user_equity[venue] = equity
+            venue_equity[user_id] = equity
             
             # Store history if needed
             if store_in_history:
@@ -242,15 +238,14 @@ class EquityStorage:
                 history_key = f"{user_id}:{venue}"
                 
                 # Initialize history list if needed
-                if history_key not in self._equity_history:
-                    self._equity_history[history_key] = []
+                history = self._equity_history.setdefault(history_key, [])
                     
                 # Add to front of list (most recent first)
-                self._equity_history[history_key].insert(0, equity)
+                history.insert(0, equity)
                 
                 # Trim list to keep only most recent 100 entries
-                if len(self._equity_history[history_key]) > 100:
-                    self._equity_history[history_key] = self._equity_history[history_key][:100]
+                if len(history) > 100:
+                    self._equity_history[history_key] = history[:100]
                     
             # Update time series if significant or at 15-minute interval
             add_to_timeseries = store_in_history
@@ -264,25 +259,24 @@ class EquityStorage:
                 timeseries_key = f"{user_id}:{venue}"
                 
                 # Initialize timeseries if needed
-                if timeseries_key not in self._equity_timeseries:
-                    self._equity_timeseries[timeseries_key] = []
+                timeseries = self._equity_timeseries.setdefault(timeseries_key, [])
                     
                 # Add data point
                 timestamp_ms = int(equity.timestamp.timestamp() * 1000)
-                self._equity_timeseries[timeseries_key].append({
+                timeseries.append({
                     "timestamp": timestamp_ms,
                     "wallet_balance": equity.wallet_balance,
                     "available_balance": equity.available_balance
                 })
                 
                 # Sort by timestamp
-                self._equity_timeseries[timeseries_key].sort(key=lambda x: x["timestamp"])
+                timeseries.sort(key=lambda x: x["timestamp"])
                 
                 # Trim to 500 points max
-                if len(self._equity_timeseries[timeseries_key]) > 500:
-                    self._equity_timeseries[timeseries_key] = self._equity_timeseries[timeseries_key][-500:]
+                if len(timeseries) > 500:
+                    self._equity_timeseries[timeseries_key] = timeseries[-500:]
                     
-            logger.debug(f"Stored equity for {venue} for user {user_id} in memory (history: {store_in_history})")
+            logger.debug("Stored equity for %s for user %s in memory (history: %s)", venue, user_id, store_in_history)
             return store_in_history
     
     def get_all_equity(self) -> Dict[int, Dict[str, Any]]:
@@ -5,11 +5,11 @@ Provides in-memory storage for job data.
 Handles job storage, retrieval, and categorization by type.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from threading import Lock
 
-from src.models.job_models import Job
+from src.models.job_models import Job, JobKind
 from src.utils.log_util import get_logger
 
 logger = get_logger()
@@ -30,6 +30,13 @@ class JobStorage:
         self._dca_jobs = {}  # user_id -> job_id -> Job
         self._liq_jobs = {}  # user_id -> job_id -> Job
         self._job_to_user_map = {}  # job_id -> user_id
+        self._active_jobs = {}  # user_id -> job_id -> Job, non-terminal jobs only
+
+        # Job kind -> per-strategy collection the job is also indexed in
+        self._strategy_jobs = {
+            JobKind.DCA: self._dca_jobs,
+            JobKind.LIQ: self._liq_jobs,
+        }
 
         self._lock = Lock()
 
@@ -53,24 +60,22 @@ class JobStorage:
             # Store the mapping
             self._job_to_user_map[job_id] = user_id
 
-            # Initialize user's state if needed
-            if user_id not in self._jobs_state:
-                self._jobs_state[user_id] = {}
+            # Store the job instance, initializing the user's state if needed
+            self._jobs_state.setdefault(user_id, {})[job_id] = job
 
-            # Store the job instance
-            self._jobs_state[user_id][job_id] = job
+            # Track non-terminal jobs so active lookups don't rescan the history
+            active_jobs = self._active_jobs.setdefault(user_id, {})
+            if job.is_active:
+                active_jobs[job_id] = job
+            else:
+                active_jobs.pop(job_id, None)
 
             # Categorize job by type
-            if job.is_dca_job:
-                if user_id not in self._dca_jobs:
-                    self._dca_jobs[user_id] = {}
-                self._dca_jobs[user_id][job_id] = job
-            elif job.is_liq_job:
-                if user_id not in self._liq_jobs:
-                    self._liq_jobs[user_id] = {}
-                self._liq_jobs[user_id][job_id] = job
+            strategy_jobs = self._strategy_jobs.get(job.kind)
+            if strategy_jobs is not None:
+                strategy_jobs.setdefault(user_id, {})[job_id] = job
             
-            logger.debug(f"Stored job {job_id} for user {user_id} in memory (job status: {job.status})")
+            logger.debug("Stored job %s for user %s in memory (job status: %s)", job_id, user_id, job.status)
 
     def get_job(self, job_id: int) -> Optional[Job]:
         """
@@ -86,7 +91,8 @@ class JobStorage:
             user_id = self._job_to_user_map.get(job_id)
             if not user_id:
                 return None
-            return self._jobs_state.get(user_id, {}).get(job_id)
+            jobs = self._jobs_state.get(user_id)
+            return jobs.get(job_id) if jobs else None
 
     def _filter_jobs_by_timeframe(self, jobs: Dict[int, Job], hours: int) -> Dict[int, Job]:
         """
@@ -126,10 +132,42 @@ class JobStorage:
             Dictionary of jobs for the user within the specified timeframe
         """
         with self._lock:
-            if user_id not in self._jobs_state:
+            jobs = self._jobs_state.get(user_id)
+            if jobs is None:
                 return {}
-                
-            return self._filter_jobs_by_timeframe(self._jobs_state[user_id], hours)
+
+            return self._filter_jobs_by_timeframe(jobs, hours)
+
+    def get_user_active_jobs(self, user_id: int, hours: int = 0) -> Dict[int, Job]:
+        """
+        Get the active (not finished or stopped) jobs of a user within a specified timeframe.
+
+        Args:
+            user_id: The ID of the user
+            hours: Number of hours to look back (default: 0, meaning all jobs)
+
+        Returns:
+            Dictionary of active jobs for the user within the specified timeframe
+        """
+        with self._lock:
+            jobs = self._active_jobs.get(user_id)
+            if jobs is None:
+                return {}
+
+            return self._filter_jobs_by_timeframe(jobs, hours)
+
+    def get_user_active_job_count(self, user_id: int) -> int:
+        """
+        Get the number of active jobs of a user, regardless of when they were created.
+
+        Args:
+            user_id: The ID of the user
+
+        Returns:
+            Number of active jobs for the user
+        """
+        with self._lock:
+            return len(self._active_jobs.get(user_id, ()))
 
     def get_job_user(self, job_id: int) -> Optional[int]:
         """
@@ -144,6 +182,30 @@ class JobStorage:
         with self._lock:
             return self._job_to_user_map.get(job_id)
 
+    def get_user_ids(self) -> List[int]:
+        """
+        Get the IDs of all users that have stored jobs.
+
+        Returns:
+            List of user IDs
+        """
+        with self._lock:
+            return list(self._jobs_state)
+
+    def get_job_counts(self) -> Tuple[int, int, int]:
+        """
+        Get the number of stored jobs without copying the job state.
+
+        Returns:
+            Tuple of (total jobs, DCA jobs, LIQ jobs)
+        """
+        with self._lock:
+            return (
+                sum(map(len, self._jobs_state.values())),
+                sum(map(len, self._dca_jobs.values())),
+                sum(map(len, self._liq_jobs.values())),
+            )
+
     def get_jobs_state(self, hours: int = 0) -> Dict[int, Dict[int, Job]]:
         """
         Get a copy of the entire jobs state, optionally filtered by timeframe.
@@ -267,12 +329,17 @@ class JobStorage:
                 # Clear LIQ jobs
                 if user_id in self._liq_jobs:
                     del self._liq_jobs[user_id]
+
+                # Clear active jobs index
+                if user_id in self._active_jobs:
+                    del self._active_jobs[user_id]
             else:
                 # Clear all job data
                 self._jobs_state.clear()
                 self._dca_jobs.clear()
                 self._liq_jobs.clear()
                 self._job_to_user_map.clear()
+                self._active_jobs.clear()
 
     def clear_all_job_data(self) -> None:
         """Clear all job data."""
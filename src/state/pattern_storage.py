@@ -3,6 +3,7 @@ Pattern Storage
 
 Manages storage and retrieval of risk evaluation patterns per user.
 """
+import logging
 from datetime import datetime, timedelta, timezone
 from threading import Lock
 from typing import Dict, List, Optional
@@ -77,14 +78,15 @@ class PatternStorage:
             self._patterns[user_id] = existing_patterns
             self._clear_old_patterns()
 
-            logger.debug(f"Stored {len(patterns)} patterns for user {user_id} "
-                         f"({len(unique_patterns)} unique, {len(non_unique_patterns)} non-unique)")
-            logger.debug(f"Total patterns in storage for user {user_id}: {len(existing_patterns)}")
-            for pattern in existing_patterns:
-                logger.debug(f"Pattern: {pattern.pattern_id} "
-                             f"(unique={pattern.unique}, "
-                             f"positions_key={pattern.position_key}, "
-                             f"job_id={pattern.job_id})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Stored {len(patterns)} patterns for user {user_id} "
+                             f"({len(unique_patterns)} unique, {len(non_unique_patterns)} non-unique)")
+                logger.debug(f"Total patterns in storage for user {user_id}: {len(existing_patterns)}")
+                for pattern in existing_patterns:
+                    logger.debug(f"Pattern: {pattern.pattern_id} "
+                                 f"(unique={pattern.unique}, "
+                                 f"positions_key={pattern.position_key}, "
+                                 f"job_id={pattern.job_id})")
 
     def store_composite_patterns(self, user_id: int, patterns: List[CompositePattern]) -> None:
         """
@@ -95,9 +97,7 @@ class PatternStorage:
             patterns: List of composite patterns to store
         """
         with self._lock:
-            if user_id not in self._composite_patterns:
-                self._composite_patterns[user_id] = []
-            self._composite_patterns[user_id].extend(patterns)
+            self._composite_patterns.setdefault(user_id, []).extend(patterns)
 
             self._clear_old_patterns()
 
@@ -162,8 +162,9 @@ class PatternStorage:
                         patterns.append(pattern)
                 
                 logger.info(f"[PatternStorage] Found {len(patterns)} active patterns within timeframe")
-                for pattern in patterns:
-                    logger.debug(f"[PatternStorage] Pattern: {pattern.pattern_id} (start_time={pattern.start_time}, end_time={pattern.end_time}, is_active={pattern.is_active})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for pattern in patterns:
+                        logger.debug(f"[PatternStorage] Pattern: {pattern.pattern_id} (start_time={pattern.start_time}, end_time={pattern.end_time}, is_active={pattern.is_active})")
                 
                 return patterns
         except Exception as e:
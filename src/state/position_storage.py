@@ -101,15 +101,16 @@ class PositionStorage:
         if hours is not None:
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
 
-        # Get active positions for this user
-        user_positions = self.get_user_positions(user_id)
-
-        for position_key, _ in user_positions.items():
-            try:
-                venue, symbol = position_key.split('_', 1)
+        # Walk the user's position keys directly; serializing the positions
+        # themselves is not needed to reach their histories
+        with self._lock:
+            for position_key in self._positions_state.get(user_id, ()):
+                if '_' not in position_key:
+                    logger.warning(f"Invalid position key format: {position_key}")
+                    continue
 
                 # Get history as Position objects
-                history_items = self.get_position_history(user_id, venue, symbol)
+                history_items = self._position_history.get(f"{user_id}:{position_key}", [])[:100]
 
                 # Filter by timeframe if specified
                 if cutoff_time is not None:
@@ -120,8 +121,6 @@ class PositionStorage:
 
                 # Store with position key
                 histories[position_key] = history_items
-            except ValueError:
-                logger.warning(f"Invalid position key format: {position_key}")
 
         return histories
 
@@ -463,12 +462,10 @@ class PositionStorage:
             venue = position.venue
             position_key = position.position_key
 
-            if user_id not in self._positions_state:
-                self._positions_state[user_id] = {}
-            if venue not in self._venue_positions:
-                self._venue_positions[venue] = {}
+            user_positions = self._positions_state.setdefault(user_id, {})
+            venue_positions = self._venue_positions.setdefault(venue, {})
 
-            prev_position = self._positions_state.get(user_id, {}).get(position_key)
+            prev_position = user_positions.get(position_key)
             store_in_history = False
             if position.update_type in [PositionUpdateType.INCREASED, PositionUpdateType.DECREASED,
                                         PositionUpdateType.CLOSED]:
@@ -510,23 +507,23 @@ class PositionStorage:
                         store_in_history = True
 
             # Always update current state
-            self._positions_state[user_id][position_key] = position
-            self._venue_positions[venue][position_key] = position
+            user_positions[position_key] = position
+            venue_positions[position_key] = position
 
             if store_in_history:
                 history_key = f"{user_id}:{position_key}"
-                if history_key not in self._position_history:
-                    self._position_history[history_key] = []
+                history = self._position_history.setdefault(history_key, [])
 
                 # Store a copy of the Position object to avoid reference issues
-                position_copy = Position.from_dict(position.to_dict())
+                # (a model copy: the stored position is already validated)
+                position_copy = position.model_copy()
 
                 # Add to front of list
-                self._position_history[history_key].insert(0, position_copy)
+                history.insert(0, position_copy)
 
                 # Trim list to keep only most recent 100 entries
-                if len(self._position_history[history_key]) > 100:
-                    self._position_history[history_key] = self._position_history[history_key][:100]
+                if len(history) > 100:
+                    self._position_history[history_key] = history[:100]
 
             # Update time series if significant or at 15-minute interval
             add_to_timeseries = store_in_history
@@ -540,24 +537,23 @@ class PositionStorage:
                 timeseries_key = f"{user_id}:{position_key}"
 
                 # Initialize timeseries if needed
-                if timeseries_key not in self._position_timeseries:
-                    self._position_timeseries[timeseries_key] = []
+                timeseries = self._position_timeseries.setdefault(timeseries_key, [])
 
                 # Add data point
                 timestamp_ms = int(position.timestamp.timestamp() * 1000)
-                self._position_timeseries[timeseries_key].append({
+                timeseries.append({
                     "timestamp": timestamp_ms,
                     "value": position.unrealized_pnl
                 })
 
                 # Sort by timestamp
-                self._position_timeseries[timeseries_key].sort(key=lambda x: x["timestamp"])
+                timeseries.sort(key=lambda x: x["timestamp"])
 
                 # Trim to 500 points max
-                if len(self._position_timeseries[timeseries_key]) > 500:
-                    self._position_timeseries[timeseries_key] = self._position_timeseries[timeseries_key][-500:]
+                if len(timeseries) > 500:
+                    self._position_timeseries[timeseries_key] = timeseries[-500:]
 
-            logger.debug(f"Stored position {position_key} for user {user_id} in memory (history: {store_in_history})")
+            logger.debug("Stored position %s for user %s in memory (history: %s)", position_key, user_id, store_in_history)
             return store_in_history
 
     def get_positions_in_time_window(self, user_id: int, start_time: datetime, end_time: datetime) -> Dict[
@@ -3,6 +3,7 @@ Utility functions for datetime operations.
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Union
 
 
@@ -30,43 +31,58 @@ def parse_timestamp(timestamp: Union[str, float, int, datetime]) -> datetime:
         
     # Handle string timestamps
     if isinstance(timestamp, str):
-        # Handle Kafka-style timestamps (with Z for UTC)
-        if 'Z' in timestamp:
-            # Remove the 'Z' and parse
-            ts = timestamp.rstrip('Z')
-            
-            # Handle precision beyond microseconds
-            if '.' in ts:
-                parts = ts.split('.')
-                # Python only handles microseconds (6 digits)
-                if len(parts[1]) > 6:
-                    ts = f"{parts[0]}.{parts[1][:6]}"
-            
-            # Parse and add UTC timezone
-            try:
-                dt = datetime.fromisoformat(ts)
-                return dt.replace(tzinfo=timezone.utc)
-            except ValueError:
-                pass  # Try other formats
-                
-        # Try ISO 8601 with timezone
+        return _parse_timestamp_str(timestamp)
+
+    # If all parsing attempts fail
+    raise ValueError(f"Could not parse timestamp: {timestamp}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_str(timestamp: str) -> datetime:
+    """
+    Parse a string timestamp into a timezone-aware datetime object.
+
+    Memoized because events in a batch frequently share the same timestamp string;
+    the returned datetime is immutable so cached instances can be shared safely.
+    """
+    # Handle Kafka-style timestamps (with Z for UTC)
+    if 'Z' in timestamp:
+        # Remove the 'Z' and parse
+        ts = timestamp.rstrip('Z')
+
+        # Handle precision beyond microseconds
+        if '.' in ts:
+            parts = ts.split('.')
+            # Python only handles microseconds (6 digits)
+            if len(parts[1]) > 6:
+                ts = f"{parts[0]}.{parts[1][:6]}"
+
+        # Parse and add UTC timezone
         try:
-            return datetime.fromisoformat(timestamp)
+            dt = datetime.fromisoformat(ts)
+            return dt.replace(tzinfo=timezone.utc)
         except ValueError:
-            pass
-            
-        # Try ISO without timezone (assume UTC)
-        try:
-            dt = DateTimeUtils.parse_timestamp(timestamp)
-            if dt:
-                return dt.replace(tzinfo=timezone.utc)
-        except:
-            pass
-    
+            pass  # Try other formats
+
+    # Try ISO 8601 with timezone
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        pass
+
+    # Try ISO without timezone (assume UTC)
+    try:
+        dt = DateTimeUtils.parse_timestamp(timestamp)
+        if dt:
+            return dt.replace(tzinfo=timezone.utc)
+    except:
+        pass
+
     # If all parsing attempts fail
     raise ValueError(f"Could not parse timestamp: {timestamp}")
 
 
+@lru_cache(maxsize=4096)
 def format_timestamp(dt: datetime) -> str:
     """
     Format a datetime to Kafka-compatible ISO 8601 string with Z timezone.
@@ -1,5 +1,6 @@
 import logging.config
 import os
+import sys
 
 from src.config.config import Config
 from src.utils.paths import get_log_file_path
@@ -87,9 +88,8 @@ def get_logger(suffix: str = None) -> logging.Logger:
     if suffix:
         logger_name = f'{BASE_LOGGER_PREFIX}.{suffix}'
     else:
-        import inspect
-        frame = inspect.stack()[1]
-        module_file = frame.frame.f_globals.get('__file__')
+        # sys._getframe avoids inspect.stack(), which resolves source context for every frame
+        module_file = sys._getframe(1).f_globals.get('__file__')
         module_name = os.path.splitext(os.path.basename(module_file))[0] if module_file else 'unknown'
         logger_name = f'{BASE_LOGGER_PREFIX}.{module_name}'
     return logging.getLogger(logger_name)
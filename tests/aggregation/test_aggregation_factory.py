@@ -0,0 +1,61 @@
+import unittest
+from src.risk.aggregation_factory import AggregationFactory
+from src.models.risk_models import AtomicPattern, CompositePattern, RiskCategory, RiskLevel
+
+
+def create_atomic(severity: float, category_weights: dict) -> AtomicPattern:
+    """Create an atomic pattern with common default values"""
+    return AtomicPattern(pattern_id="atomic", message="test", severity=severity, category_weights=category_weights)
+
+
+def create_composite(confidence: float, category_weights: dict) -> CompositePattern:
+    """Create a composite pattern with common default values"""
+    return CompositePattern(pattern_id="composite", message="test", confidence=confidence, is_composite=True,
+                            component_patterns=[], category_weights=category_weights)
+
+
+class TestAggregationFactory(unittest.TestCase):
+    def test_calculate_risk_level_boundaries(self):
+        """Test that each threshold maps to the expected risk level."""
+        cases = [
+            (-0.1, RiskLevel.NONE),
+            (0.0, RiskLevel.NONE),
+            (0.01, RiskLevel.LOW),
+            (0.49, RiskLevel.LOW),
+            (0.5, RiskLevel.MEDIUM),
+            (0.69, RiskLevel.MEDIUM),
+            (0.7, RiskLevel.HIGH),
+            (0.89, RiskLevel.HIGH),
+            (0.9, RiskLevel.CRITICAL),
+            (1.0, RiskLevel.CRITICAL),
+        ]
+        for confidence, expected in cases:
+            with self.subTest(confidence=confidence):
+                self.assertEqual(AggregationFactory.calculate_risk_level(confidence), expected)
+
+    def test_calculate_risk_level_nan_is_none(self):
+        """Test that a NaN confidence maps to no risk rather than the highest level."""
+        self.assertEqual(AggregationFactory.calculate_risk_level(float("nan")), RiskLevel.NONE)
+
+    def test_composite_max_overrides_atomics_in_its_category(self):
+        """Test that a category touched by a composite takes the max composite score."""
+        report = AggregationFactory.aggregate(
+            [create_atomic(1.0, {RiskCategory.OVERCONFIDENCE: 1.0})],
+            [create_composite(0.4, {RiskCategory.OVERCONFIDENCE: 1.0}),
+             create_composite(0.6, {RiskCategory.OVERCONFIDENCE: 1.0})],
+            user_id=1,
+        )
+
+        self.assertEqual(report.category_scores[RiskCategory.OVERCONFIDENCE], 0.6)
+
+    def test_atomic_categories_take_the_halved_weighted_mean(self):
+        """Test that atomic-only categories average severity * weight * 0.5 * primary weight."""
+        report = AggregationFactory.aggregate(
+            [create_atomic(0.8, {RiskCategory.OVERCONFIDENCE: 1.0}),
+             create_atomic(0.4, {RiskCategory.OVERCONFIDENCE: 1.0})],
+            [],
+            user_id=1,
+        )
+
+        self.assertEqual(report.category_scores[RiskCategory.OVERCONFIDENCE], 0.3)
+        self.assertEqual(report.top_risk_level, RiskLevel.LOW)
@@ -0,0 +1,138 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from src.config.config import Config
+from src.risk.evaluators import user_limits
+from src.risk.evaluators.user_limits import _get_user_limits, prefetch_user_limits
+
+
+def create_response(user_id: int) -> Mock:
+    """Create a successful user limits API response"""
+    response = Mock(status_code=200)
+    response.json.return_value = {"id": 1, "userId": user_id, "maxDailyTrades": 7}
+    return response
+
+
+class TestUserLimitsCache(unittest.TestCase):
+    def setUp(self):
+        user_limits._user_limits_cache.clear()
+        user_limits._failed_user_limits.clear()
+
+    def tearDown(self):
+        user_limits._user_limits_cache.clear()
+        user_limits._failed_user_limits.clear()
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_limits_are_fetched_once_within_ttl(self, mock_get):
+        mock_get.return_value = create_response(42)
+
+        first = _get_user_limits(42)
+        second = _get_user_limits(42)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertIs(first, second)
+        self.assertEqual(second.max_daily_trades, 7)
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_expired_limits_are_served_while_refreshing(self, mock_get):
+        mock_get.return_value = create_response(42)
+
+        with patch.object(Config, 'USER_LIMITS_CACHE_TTL', 0):
+            first = _get_user_limits(42)
+            second = _get_user_limits(42)
+            refresh = user_limits._inflight_user_limits.get(42)
+            if refresh is not None:
+                refresh.result(timeout=5)
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertIsNot(user_limits._user_limits_cache[42][0], first)
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_limits_past_max_staleness_are_refetched(self, mock_get):
+        mock_get.return_value = create_response(42)
+
+        with patch.object(Config, 'USER_LIMITS_CACHE_TTL', 0), \
+                patch.object(Config, 'USER_LIMITS_MAX_STALENESS', 0):
+            first = _get_user_limits(42)
+            second = _get_user_limits(42)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_refresh_after_shutdown_does_not_block_later_fetches(self, mock_get):
+        mock_get.return_value = create_response(42)
+        stopped_executor = ThreadPoolExecutor(max_workers=1)
+        stopped_executor.shutdown()
+
+        with patch.object(Config, 'USER_LIMITS_CACHE_TTL', 0), \
+                patch.object(user_limits, '_refresh_executor', stopped_executor):
+            first = _get_user_limits(42)
+            second = _get_user_limits(42)
+
+        self.assertIs(first, second)
+        self.assertNotIn(42, user_limits._inflight_user_limits)
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_least_recently_used_user_is_evicted(self, mock_get):
+        mock_get.side_effect = lambda url, timeout: create_response(int(url.split('/')[-2]))
+
+        with patch.object(Config, 'USER_LIMITS_CACHE_SIZE', 2):
+            _get_user_limits(1)
+            _get_user_limits(2)
+            _get_user_limits(1)
+            _get_user_limits(3)
+
+        self.assertEqual(list(user_limits._user_limits_cache), [1, 3])
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_failed_fetch_is_not_retried_within_failure_ttl(self, mock_get):
+        mock_get.return_value = Mock(status_code=503)
+
+        self.assertIsNone(_get_user_limits(42))
+        self.assertIsNone(_get_user_limits(42))
+        self.assertEqual(mock_get.call_count, 1)
+
+        with patch.object(Config, 'USER_LIMITS_FAILURE_TTL', 0):
+            _get_user_limits(42)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_concurrent_misses_share_one_fetch(self, mock_get):
+        fetch_started = threading.Event()
+        release = threading.Event()
+
+        def slow_response(url, timeout):
+            fetch_started.set()
+            release.wait(5)
+            return create_response(42)
+
+        mock_get.side_effect = slow_response
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_get_user_limits, 42) for _ in range(4)]
+            try:
+                self.assertTrue(fetch_started.wait(5), "limits fetch did not start")
+            finally:
+                release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    @patch('src.risk.evaluators.user_limits._session.get')
+    def test_prefetch_fetches_only_uncached_users(self, mock_get):
+        mock_get.side_effect = lambda url, timeout: create_response(int(url.split('/')[-2]))
+        _get_user_limits(1)
+
+        prefetch_user_limits([1, 2, 3, 3])
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(sorted(user_limits._user_limits_cache), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
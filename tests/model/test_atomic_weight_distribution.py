@@ -25,3 +25,15 @@ class TestAtomicWeightDistribution(unittest.TestCase):
         )
         self.assertTrue(len(pattern.category_weights.items()) > 1)
         self.assertEqual(sum(pattern.category_weights.values()), 1.0)
+
+    def test_weights_follow_category_order(self):
+        pattern = AtomicPattern(
+            pattern_id="position_long_holding_time",
+            message="TEST",
+            severity=0.7,
+            category_weights={
+                RiskCategory.LOSS_BEHAVIOR: 0.6,
+            },
+        )
+        self.assertEqual(pattern.weights, (0.2, 0.2, 0.6))
+        self.assertEqual(pattern.category, RiskCategory.LOSS_BEHAVIOR)
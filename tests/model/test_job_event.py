@@ -0,0 +1,65 @@
+import unittest
+from src.main import TradeGuardHealth
+from src.models.job_updates import JobEvent
+from src.state.state_manager import StateManager
+
+
+def create_message(update_type, timestamp: str = None) -> dict:
+    """Create a job event message for job 7, optionally without a timestamp"""
+    message = {"job_id": 7, "update_type": update_type}
+    if timestamp is not None:
+        message["timestamp"] = timestamp
+    return message
+
+
+def orders_placed(quantity: float = 2.0) -> dict:
+    """Create an OrdersPlaced payload whose orders carry no timestamps"""
+    return {"OrdersPlaced": [{"order_id": "1", "symbol": "BTC", "price": 10.0, "quantity": quantity}]}
+
+
+class TestJobEventRedelivery(unittest.TestCase):
+    def setUp(self):
+        """Build the service's job event path without its Kafka connections."""
+        self.service = TradeGuardHealth.__new__(TradeGuardHealth)
+        self.service.state_manager = StateManager()
+        self.service._last_job_events = {}
+        created = {"Created": {"user_id": 1, "name": "dca", "coins": ["BTC"]}}
+        self.process(create_message(created, "2024-01-01T00:00:00Z"))
+
+    def process(self, message: dict) -> None:
+        self.service._process_job_event(JobEvent.from_dict(message), is_historical=True)
+
+    def orders(self) -> list:
+        return self.service.state_manager.job_storage.get_job(7).orders
+
+    def test_redelivered_event_is_applied_once(self):
+        """Test that timestamps filled in at parse time don't hide a redelivered message."""
+        message = create_message(orders_placed(), "2024-01-01T00:01:00Z")
+        self.process(message)
+        self.process(message)
+
+        self.assertEqual(len(self.orders()), 1)
+
+    def test_events_with_same_timestamp_and_different_payload_are_applied(self):
+        """Test that distinct payloads sharing a source timestamp are both applied."""
+        self.process(create_message(orders_placed(2.0), "2024-01-01T00:01:00Z"))
+        self.process(create_message(orders_placed(3.0), "2024-01-01T00:01:00Z"))
+
+        self.assertEqual(len(self.orders()), 2)
+
+    def test_events_without_source_timestamp_are_not_deduplicated(self):
+        """Test that events without a source timestamp always apply."""
+        self.process(create_message(orders_placed()))
+        self.process(create_message(orders_placed()))
+
+        self.assertEqual(len(self.orders()), 2)
+
+    def test_terminal_jobs_are_forgotten(self):
+        """Test that a job's last event is dropped once the job finishes."""
+        self.process(create_message("Finished", "2024-01-01T00:02:00Z"))
+
+        self.assertNotIn(7, self.service._last_job_events)
+
+
+if __name__ == '__main__':
+    unittest.main()
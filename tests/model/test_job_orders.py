@@ -0,0 +1,34 @@
+import unittest
+from src.models.job_models import Job
+from src.models.job_updates import OpenOrderLog
+
+
+class TestJobOrders(unittest.TestCase):
+    def test_partial_order_dicts_are_accepted(self):
+        """Test that stored order dicts missing fields load with the OrdersPlaced defaults."""
+        job = Job.from_dict({
+            "job_id": 1,
+            "user_id": 1,
+            "timestamp": "2024-01-01T00:00:00Z",
+            "orders": [{"order_id": "1", "price": "10.5"}],
+        })
+
+        order = job.orders[0]
+        self.assertIsInstance(order, OpenOrderLog)
+        self.assertEqual((order.order_id, order.symbol, order.price, order.quantity), ("1", "", 10.5, 0.0))
+        self.assertTrue(order.timestamp)
+
+    def test_orders_round_trip_through_to_dict(self):
+        """Test that a dumped job loads back with the same orders."""
+        job = Job.from_dict({
+            "job_id": 1,
+            "user_id": 1,
+            "timestamp": "2024-01-01T00:00:00Z",
+            "orders": [{"order_id": "1", "symbol": "BTC", "timestamp": "2024-01-01T00:00:00Z"}],
+        })
+
+        self.assertEqual(Job.from_dict(job.to_dict()).orders, job.orders)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime, timezone
+from src.models.risk_models import AtomicPattern, CompositePattern
+
+
+START_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def create_atomic(**overrides) -> AtomicPattern:
+    """Create an atomic pattern with a fixed start time"""
+    data = {"pattern_id": "position_drawdown", "message": "TEST", "severity": 0.5, "start_time": START_TIME}
+    data.update(overrides)
+    return AtomicPattern(**data)
+
+
+class TestPatternInternalId(unittest.TestCase):
+    def test_non_finite_scores_are_fingerprinted(self):
+        """Test that NaN and infinite scores yield distinct ids instead of raising."""
+        ids = {
+            create_atomic(severity=severity).internal_id
+            for severity in (float('nan'), float('inf'), float('-inf'), 1e300)
+        }
+        composite = CompositePattern(
+            pattern_id="composite_tilt", message="TEST", confidence=float('nan'), component_patterns=["a"],
+            is_composite=True, start_time=START_TIME,
+        )
+
+        self.assertEqual(len(ids), 4)
+        self.assertTrue(composite.internal_id.startswith("composite:"))
+
+    def test_job_ids_beyond_64_bits_are_fingerprinted(self):
+        """Test that job ids outside the signed 64-bit range yield an id instead of raising."""
+        small = create_atomic(job_id=[1])
+        large = create_atomic(job_id=[2 ** 63])
+
+        self.assertNotEqual(small.internal_id, large.internal_id)
+
+    def test_scores_collapse_to_two_decimals(self):
+        """Test that scores equal at 2-decimal resolution share an id."""
+        first = create_atomic(severity=0.501)
+        second = create_atomic(severity=0.499)
+
+        self.assertEqual(first.internal_id, second.internal_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
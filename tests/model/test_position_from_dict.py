@@ -0,0 +1,56 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from src.models.position_models import Position, PositionUpdateType
+
+
+def create_position_data(**overrides) -> dict:
+    """Create a flat position payload with common default values"""
+    data = {
+        "venue": "BYBIT",
+        "symbol": "BTC",
+        "side": "Buy",
+        "qty": 1.0,
+        "usdt_amt": 100.0,
+        "entry_price": 100.0,
+        "mark_price": 101.0,
+        "unrealized_pnl": 1.0,
+        "cur_realized_pnl": 0.0,
+        "cum_realized_pnl": 0.0,
+        "leverage": 5.0,
+        "timestamp": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "account_name": "main",
+        "user_id": 1,
+        "update_type": "Snapshot",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestPositionFromDict(unittest.TestCase):
+    def test_typed_payload_is_validated_once(self):
+        """Test that an already-typed flat payload goes straight to model_validate."""
+        with patch.object(Position, "model_validate", wraps=Position.model_validate) as validate:
+            position = Position.from_dict(create_position_data())
+
+        validate.assert_called_once()
+        self.assertEqual(position.update_type, PositionUpdateType.SNAPSHOT)
+
+    def test_string_fields_take_the_lenient_path(self):
+        """Test that string numbers and Kafka timestamps are coerced without a model_validate attempt."""
+        data = create_position_data(qty=" 2.5 ", timestamp="2025-01-01T00:00:00.123456789Z")
+        with patch.object(Position, "model_validate", wraps=Position.model_validate) as validate:
+            position = Position.from_dict(data)
+
+        validate.assert_not_called()
+        self.assertEqual(position.qty, 2.5)
+        self.assertEqual(position.timestamp, datetime(2025, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc))
+
+    def test_malformed_payload_raises(self):
+        """Test that a malformed payload still raises."""
+        with self.assertRaises(ValueError):
+            Position.from_dict(create_position_data(qty="not-a-number"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import json
+import unittest
+from datetime import datetime, timezone
+from pydantic import ValidationError
+from src.models.risk_models import RiskCategory, RiskLevel, RiskRepost
+
+
+def create_report_data(**overrides) -> dict:
+    """Create raw report data with common default values"""
+    data = {
+        "user_id": 1,
+        "top_risk_level": "high",
+        "top_risk_confidence": 0.8,
+        "top_risk_type": RiskCategory.OVERCONFIDENCE.value,
+        "category_scores": {RiskCategory.OVERCONFIDENCE.value: 0.8},
+        "patterns": [],
+        "composite_patterns": [],
+    }
+    data.update(overrides)
+    return data
+
+
+class TestRiskReport(unittest.TestCase):
+    def test_raw_enum_values_are_resolved(self):
+        """Test that raw level and category values validate to their enum members."""
+        report = RiskRepost(**create_report_data())
+
+        self.assertEqual(report.top_risk_level, RiskLevel.HIGH)
+        self.assertEqual(report.top_risk_type, RiskCategory.OVERCONFIDENCE)
+
+    def test_unhashable_enum_values_raise_validation_error(self):
+        """Test that unhashable level and category values are rejected by pydantic."""
+        for field in ("top_risk_level", "top_risk_type"):
+            with self.subTest(field=field):
+                with self.assertRaises(ValidationError):
+                    RiskRepost(**create_report_data(**{field: ["high"]}))
+
+    def test_timestamp_is_serialized_in_kafka_format(self):
+        """Test that JSON output uses the shared UTC 'Z' timestamp while model_dump keeps the datetime."""
+        timestamp = datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)
+        report = RiskRepost(**create_report_data(timestamp=timestamp))
+
+        self.assertEqual(json.loads(report.to_kafka_bytes())["timestamp"], "2025-01-01T12:30:00.000Z")
+        self.assertEqual(report.model_dump()["timestamp"], timestamp)
+
+
+if __name__ == '__main__':
+    unittest.main()
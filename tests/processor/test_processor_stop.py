@@ -0,0 +1,64 @@
+import unittest
+from threading import Event, Thread
+from unittest.mock import patch
+from src.risk import processor
+from src.state.state_manager import StateManager
+
+
+class BlockingEvaluator:
+    """Evaluator that waits for the test to release it"""
+    evaluator_id = "blocking"
+
+    def __init__(self):
+        self.started = Event()
+        self.release = Event()
+        self.finished = Event()
+
+    async def evaluate(self, user_id):
+        self.started.set()
+        self.release.wait(5)
+        self.finished.set()
+        return []
+
+
+class TestRiskProcessorStop(unittest.TestCase):
+    def setUp(self):
+        self.evaluator = BlockingEvaluator()
+        with patch.object(processor, "create_evaluators", lambda state_manager: {"blocking": self.evaluator}):
+            self.processor = processor.RiskProcessor(StateManager())
+
+    def tearDown(self):
+        self.evaluator.release.set()
+        self.processor.stop()
+
+    def test_stop_drains_partitions_before_closing_the_shared_executor(self):
+        """Test that stop() waits for in-flight partition tasks while the shared executor still accepts work."""
+        self.processor.run_evaluators(["blocking"], 1)
+        self.assertTrue(self.evaluator.started.wait(5))
+
+        stopper = Thread(target=self.processor.stop)
+        stopper.start()
+        stopper.join(0.2)
+        self.assertTrue(stopper.is_alive())
+        self.assertFalse(self.processor.executor._shutdown)
+
+        self.evaluator.release.set()
+        stopper.join(5)
+        self.assertFalse(stopper.is_alive())
+        self.assertTrue(self.evaluator.finished.is_set())
+        self.assertTrue(self.processor.executor._shutdown)
+
+    def test_pending_evaluations_are_skipped_after_stop(self):
+        """Test that a partition task starting after stop() submits nothing to the shared executor."""
+        self.processor._pending_evaluations[1] = {"blocking"}
+        self.processor._stop_event.set()
+
+        with patch.object(self.processor.executor, "submit") as submit:
+            self.processor._run_pending_evaluations(1)
+
+        submit.assert_not_called()
+        self.assertNotIn(1, self.processor._pending_evaluations)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime, timezone
+from src.models.job_models import Job
+from src.state.job_storage import JobStorage
+
+
+def create_job(job_id: int, status: str, user_id: int = 1, name: str = "dca") -> Job:
+    """Create a job with common default values"""
+    now = datetime.now(timezone.utc)
+    return Job(job_id=job_id, user_id=user_id, name=name, timestamp=now, last_updated=now, status=status)
+
+
+class TestJobStorage(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.storage = JobStorage()
+
+    def tearDown(self):
+        """Clean up test fixtures after each test method."""
+        self.storage.clear_all_job_data()
+
+    def test_active_jobs_follow_status_transitions(self):
+        """Test that jobs leave the active index once they reach a terminal status."""
+        self.storage.store_job(create_job(1, "Created"))
+        self.storage.store_job(create_job(2, "Created"))
+        self.storage.store_job(create_job(3, "In Progress"))
+        self.storage.store_job(create_job(2, "Finished"))
+
+        self.assertEqual(list(self.storage.get_user_active_jobs(1, 24)), [1, 3])
+        self.assertEqual(len(self.storage.get_user_jobs(1, 24)), 3)
+
+    def test_active_job_count(self):
+        """Test that the active job count tracks the active jobs index."""
+        self.storage.store_job(create_job(1, "Created"))
+        self.storage.store_job(create_job(2, "Created"))
+        self.storage.store_job(create_job(1, "Stopped"))
+
+        self.assertEqual(self.storage.get_user_active_job_count(1), 1)
+        self.assertEqual(self.storage.get_user_active_job_count(2), 0)
+
+    def test_clear_user_jobs_clears_active_jobs(self):
+        """Test that clearing a user's jobs also clears their active jobs."""
+        self.storage.store_job(create_job(1, "Created"))
+        self.storage.clear_job_data(1)
+
+        self.assertEqual(self.storage.get_user_active_jobs(1), {})
+
+    def test_jobs_are_indexed_by_strategy(self):
+        """Test that DCA and LIQ jobs are also stored in their strategy collections."""
+        self.storage.store_job(create_job(1, "Created", name="DCA"))
+        self.storage.store_job(create_job(2, "Created", name="liq"))
+        self.storage.store_job(create_job(3, "Created", name="other"))
+
+        self.assertEqual(list(self.storage.get_dca_jobs()[1]), [1])
+        self.assertEqual(list(self.storage.get_liq_jobs()[1]), [2])
+        self.assertEqual(self.storage.get_job_counts(), (3, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()